@@ -0,0 +1,183 @@
+# backend/backup.py — incremental point-in-time snapshots of DATA_DIR
+"""
+Each snapshot is a directory BACKUP_DIR/<UTC timestamp>/ holding a copy of every
+document in DATA_DIR plus a _manifest.json (size + mtime per file).
+
+Incremental: a document whose size/mtime match the previous snapshot is hard-linked
+to that snapshot's file; only changed documents are copied. Deleting an old snapshot
+never affects newer ones (hard links are reference counted).
+
+A restore also rebases the mutation log: every restored document is appended as a
+full "put" (so replicas converge on the restored state), and the time-travel
+checkpoints are deleted, since they describe the discarded state. The app writes
+a fresh checkpoint on its next start, so history before the restore is no longer
+browsable.
+
+CLI (stop the app before restoring):
+  python backup.py snapshot
+  python backup.py list
+  python backup.py restore <snapshot>
+"""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from mutation_log import MutationLog
+
+MANIFEST_NAME = "_manifest.json"
+DOC_SUFFIXES = (".json", ".jsonl")
+
+# Sub-directories of DATA_DIR owned by main.py (not part of a snapshot).
+MUTATION_LOG_DIR_NAME = "mutations"
+CHECKPOINT_DIR_NAME = "checkpoints"
+
+
+def _documents(data_dir: Path) -> list[Path]:
+    if not data_dir.exists():
+        return []
+    return sorted(p for p in data_dir.iterdir() if p.is_file() and p.suffix in DOC_SUFFIXES)
+
+
+def _read_manifest(snapshot: Path) -> dict:
+    try:
+        with (snapshot / MANIFEST_NAME).open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def list_snapshots(backup_dir: Path) -> list[Path]:
+    """Completed snapshots, oldest first (names sort chronologically)."""
+    if not backup_dir.exists():
+        return []
+    return sorted(
+        p for p in backup_dir.iterdir() if p.is_dir() and (p / MANIFEST_NAME).exists()
+    )
+
+
+def take_snapshot(data_dir: Path, backup_dir: Path, lock=None) -> Path:
+    """
+    Snapshot all documents. `lock` should be the lock save_json holds, so the
+    snapshot never observes a half-applied write.
+    """
+    backup_dir.mkdir(parents=True, exist_ok=True)
+    previous = list_snapshots(backup_dir)
+    prev_dir = previous[-1] if previous else None
+    prev_manifest = _read_manifest(prev_dir) if prev_dir else {}
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S.%fZ")
+    staging = backup_dir / f".{stamp}.partial"
+    staging.mkdir()
+
+    manifest: dict[str, dict] = {}
+    with lock if lock is not None else nullcontext():
+        for src in _documents(data_dir):
+            st = src.stat()
+            meta = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+            dest = staging / src.name
+            prev = prev_manifest.get(src.name) or {}
+            unchanged = prev.get("size") == meta["size"] and prev.get("mtime_ns") == meta["mtime_ns"]
+            if prev_dir is not None and unchanged:
+                try:
+                    os.link(prev_dir / src.name, dest)
+                    meta["linked"] = True
+                except OSError:
+                    shutil.copy2(src, dest)
+            else:
+                shutil.copy2(src, dest)
+            manifest[src.name] = meta
+
+    with (staging / MANIFEST_NAME).open("w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    final = backup_dir / stamp
+    staging.replace(final)
+    return final
+
+
+def prune_snapshots(backup_dir: Path, keep: int) -> list[Path]:
+    """Delete the oldest snapshots beyond `keep`. Returns removed paths."""
+    snapshots = list_snapshots(backup_dir)
+    removed = snapshots[: max(0, len(snapshots) - keep)]
+    for snap in removed:
+        shutil.rmtree(snap, ignore_errors=True)
+    return removed
+
+
+def restore_snapshot(backup_dir: Path, name: str, data_dir: Path, lock=None) -> list[str]:
+    """
+    Copy every document of snapshot `name` back into data_dir (tmp + replace,
+    so restored files never share an inode with the backup).
+    """
+    snapshot = backup_dir / name
+    manifest = _read_manifest(snapshot)
+    if not manifest:
+        raise FileNotFoundError(f"snapshot not found or incomplete: {name}")
+
+    data_dir.mkdir(parents=True, exist_ok=True)
+    restored = []
+    with lock if lock is not None else nullcontext():
+        for doc_name in manifest:
+            tmp = data_dir / f"{doc_name}.restore"
+            shutil.copy2(snapshot / doc_name, tmp)
+            tmp.replace(data_dir / doc_name)
+            restored.append(doc_name)
+        _rebase_history(data_dir, restored)
+    return restored
+
+
+def _rebase_history(data_dir: Path, doc_names: list[str]) -> None:
+    log = MutationLog(data_dir / MUTATION_LOG_DIR_NAME)
+    ts = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    for doc_name in doc_names:
+        try:
+            with (data_dir / doc_name).open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            log.append({"ts": ts, "doc": doc_name, "op": "put", "data": data})
+    shutil.rmtree(data_dir / CHECKPOINT_DIR_NAME, ignore_errors=True)
+
+
+def _paths() -> tuple[Path, Path]:
+    data_dir = Path(os.getenv("DATA_DIR", "/data"))
+    backup_dir = Path(os.getenv("BACKUP_DIR", str(data_dir / "backups")))
+    return data_dir, backup_dir
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    data_dir, backup_dir = _paths()
+    cmd = argv[0] if argv else ""
+
+    if cmd == "snapshot":
+        snap = take_snapshot(data_dir, backup_dir)
+        prune_snapshots(backup_dir, int(os.getenv("BACKUP_KEEP", "24")))
+        print(snap)
+        return 0
+
+    if cmd == "list":
+        for snap in list_snapshots(backup_dir):
+            print(snap.name)
+        return 0
+
+    if cmd == "restore" and len(argv) == 2:
+        for doc_name in restore_snapshot(backup_dir, argv[1], data_dir):
+            print(f"restored {doc_name}")
+        return 0
+
+    print(__doc__.strip())
+    return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
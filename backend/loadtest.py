@@ -0,0 +1,307 @@
+# backend/loadtest.py — concurrency stress + lost-update check (stdlib only)
+"""
+Starts the API locally on a throwaway DATA_DIR, hammers it with a configurable mix
+of concurrent requests, reports throughput / tail latency per operation, then stops
+the server and checks the persisted files against the expected end state.
+
+Expected state is deterministic because every mutated object has a single owner
+at a time:
+- each top3 item and each week list (outcomes, blockers) is written under its
+  own client-side lock, so the last acknowledged value must be the persisted one;
+- each journal entry is created, patched and deleted only by the worker that
+  created it.
+Anything else found on disk is a lost update or a torn write.
+
+Usage:
+  python loadtest.py --workers 16 --duration 10 --mix toggle=40,week=10,journal=30,dashboard=20
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Optional
+
+BACKEND_DIR = Path(__file__).resolve().parent
+TOP3_IDS = ("t1", "t2", "t3")
+WEEK_KINDS = ("outcomes", "blockers")
+DEFAULT_MIX = "toggle=40,week=10,journal=30,dashboard=20"
+
+
+# -------------------------------------------------------------------
+# HTTP + server lifecycle
+# -------------------------------------------------------------------
+def _request(base_url: str, method: str, path: str, body: Optional[dict] = None) -> dict:
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    req = urllib.request.Request(base_url + path, data=data, method=method)
+    if data is not None:
+        req.add_header("Content-Type", "application/json")
+    with urllib.request.urlopen(req, timeout=30) as res:
+        return json.loads(res.read().decode("utf-8"))
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(data_dir: Path, port: int, env: Optional[dict] = None) -> tuple[subprocess.Popen, str]:
+    env = dict(os.environ, DATA_DIR=str(data_dir), BACKUP_INTERVAL_SEC="0", **(env or {}))
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 20
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("server exited during startup")
+        try:
+            _request(base_url, "GET", "/health")
+            return proc, base_url
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.1)
+    proc.terminate()
+    raise RuntimeError("server did not become healthy")
+
+
+# -------------------------------------------------------------------
+# Workload
+# -------------------------------------------------------------------
+class Expected:
+    """End state implied by acknowledged responses."""
+
+    def __init__(self) -> None:
+        self.top3_locks = {i: threading.Lock() for i in TOP3_IDS}
+        self.top3_done: dict[str, bool] = {}
+        self.week_locks = {k: threading.Lock() for k in WEEK_KINDS}
+        self.week: dict[str, list[str]] = {}
+        self.journal_lock = threading.Lock()
+        self.journal: dict[str, str] = {}  # entry id -> expected "miss"
+
+
+class Stats:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.latencies: dict[str, list[float]] = {}
+        self.errors: dict[str, int] = {}
+
+    def record(self, op: str, seconds: float, ok: bool) -> None:
+        with self.lock:
+            self.latencies.setdefault(op, []).append(seconds)
+            if not ok:
+                self.errors[op] = self.errors.get(op, 0) + 1
+
+
+def _timed(stats: Stats, op: str, fn):
+    start = time.perf_counter()
+    try:
+        result = fn()
+    except Exception:
+        stats.record(op, time.perf_counter() - start, ok=False)
+        return None
+    stats.record(op, time.perf_counter() - start, ok=True)
+    return result
+
+
+def _op_toggle(base_url: str, rng: random.Random, exp: Expected, stats: Stats) -> None:
+    item_id = rng.choice(TOP3_IDS)
+    done = rng.random() < 0.5
+    with exp.top3_locks[item_id]:
+        res = _timed(stats, "top3.toggle", lambda: _request(
+            base_url, "PATCH", f"/api/v1/today/top3/{item_id}", {"done": done}
+        ))
+        if res is not None:
+            exp.top3_done[item_id] = done
+
+
+def _op_week(base_url: str, rng: random.Random, exp: Expected, stats: Stats) -> None:
+    kind = rng.choice(WEEK_KINDS)
+    texts = [f"{kind}-{rng.randrange(10**6)}" for _ in range(3)]
+    # One lock per kind: outcomes and blockers PUTs race on the same WEEK_STATE.
+    with exp.week_locks[kind]:
+        res = _timed(stats, f"week.{kind}", lambda: _request(
+            base_url, "PUT", f"/api/v1/week/{kind}", {kind: texts}
+        ))
+        if res is not None:
+            exp.week[kind] = texts
+
+
+def _op_journal(base_url: str, rng: random.Random, exp: Expected, stats: Stats, owned: list[str]) -> None:
+    roll = rng.random()
+    if not owned or roll < 0.5:
+        miss = f"miss-{rng.randrange(10**6)}"
+        res = _timed(stats, "journal.create", lambda: _request(
+            base_url, "POST", "/api/v1/journal/daily", {"wins": ["load"], "miss": miss}
+        ))
+        if res is not None:
+            owned.append(res["id"])
+            with exp.journal_lock:
+                exp.journal[res["id"]] = miss
+    elif roll < 0.8:
+        entry_id = rng.choice(owned)
+        miss = f"patched-{rng.randrange(10**6)}"
+        res = _timed(stats, "journal.patch", lambda: _request(
+            base_url, "PATCH", f"/api/v1/journal/{entry_id}", {"miss": miss}
+        ))
+        if res is not None:
+            with exp.journal_lock:
+                exp.journal[entry_id] = miss
+    else:
+        entry_id = owned.pop(rng.randrange(len(owned)))
+        res = _timed(stats, "journal.delete", lambda: _request(
+            base_url, "DELETE", f"/api/v1/journal/{entry_id}"
+        ))
+        if res is not None:
+            with exp.journal_lock:
+                exp.journal.pop(entry_id, None)
+        else:
+            owned.append(entry_id)
+
+
+def _op_dashboard(base_url: str, stats: Stats) -> None:
+    _timed(stats, "views.dashboard", lambda: _request(base_url, "GET", "/api/v1/views/dashboard"))
+
+
+def parse_mix(spec: str) -> list[tuple[str, int]]:
+    mix = []
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ("toggle", "week", "journal", "dashboard"):
+            raise ValueError(f"unknown op in mix: {name}")
+        mix.append((name, int(weight or 1)))
+    return mix
+
+
+def run_load(base_url: str, workers: int, duration: float, mix: list[tuple[str, int]], seed: int):
+    exp = Expected()
+    stats = Stats()
+    names = [n for n, _ in mix]
+    weights = [w for _, w in mix]
+    deadline = time.monotonic() + duration
+
+    def worker(idx: int) -> None:
+        rng = random.Random(seed + idx)
+        owned: list[str] = []
+        while time.monotonic() < deadline:
+            op = rng.choices(names, weights)[0]
+            if op == "toggle":
+                _op_toggle(base_url, rng, exp, stats)
+            elif op == "week":
+                _op_week(base_url, rng, exp, stats)
+            elif op == "journal":
+                _op_journal(base_url, rng, exp, stats, owned)
+            else:
+                _op_dashboard(base_url, stats)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(workers)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return exp, stats, time.perf_counter() - started
+
+
+# -------------------------------------------------------------------
+# Reporting + verification
+# -------------------------------------------------------------------
+def _pct(sorted_values: list[float], p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[k]
+
+
+def report(stats: Stats, elapsed: float) -> None:
+    total = sum(len(v) for v in stats.latencies.values())
+    print(f"{total} requests in {elapsed:.1f}s -> {total / elapsed:.1f} req/s")
+    print(f"{'op':<18}{'count':>7}{'err':>6}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    for op in sorted(stats.latencies):
+        vals = sorted(stats.latencies[op])
+        print(
+            f"{op:<18}{len(vals):>7}{stats.errors.get(op, 0):>6}"
+            f"{_pct(vals, 50) * 1000:>9.1f}{_pct(vals, 95) * 1000:>9.1f}"
+            f"{_pct(vals, 99) * 1000:>9.1f}{vals[-1] * 1000:>9.1f}"
+        )
+
+
+def verify(data_dir: Path, exp: Expected) -> list[str]:
+    problems: list[str] = []
+    docs: dict[str, dict] = {}
+    for path in sorted(data_dir.glob("*.json")):
+        try:
+            docs[path.name] = json.loads(path.read_text(encoding="utf-8"))
+        except ValueError as e:
+            problems.append(f"torn write: {path.name} does not parse ({e})")
+    for path in data_dir.glob("*.tmp"):
+        problems.append(f"leftover temp file: {path.name}")
+
+    today = docs.get("today_state.json", {})
+    persisted_done = {it.get("id"): it.get("done") for it in today.get("top3", [])}
+    for item_id, done in exp.top3_done.items():
+        if persisted_done.get(item_id) != done:
+            problems.append(f"lost update: top3 {item_id} done={persisted_done.get(item_id)} expected {done}")
+
+    week = docs.get("week_state.json", {})
+    for kind, texts in exp.week.items():
+        persisted = [it.get("text") for it in week.get(kind, [])]
+        if persisted != texts:
+            problems.append(f"lost update: week {kind} {persisted} expected {texts}")
+
+    entries = {e.get("id"): e for e in docs.get("journal.json", {}).get("entries", [])}
+    for entry_id, miss in exp.journal.items():
+        if entry_id not in entries:
+            problems.append(f"lost update: journal entry {entry_id} missing")
+        elif entries[entry_id].get("miss") != miss:
+            problems.append(f"lost update: journal entry {entry_id} miss={entries[entry_id].get('miss')!r} expected {miss!r}")
+    for entry_id in entries.keys() - exp.journal.keys():
+        problems.append(f"resurrected/unexpected journal entry {entry_id}")
+    return problems
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Axis API concurrency stress test")
+    ap.add_argument("--workers", type=int, default=16)
+    ap.add_argument("--duration", type=float, default=10.0, help="seconds")
+    ap.add_argument("--mix", default=DEFAULT_MIX, help=f"weights, default {DEFAULT_MIX}")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--keep-data", action="store_true", help="do not delete the temp DATA_DIR")
+    args = ap.parse_args(argv)
+
+    data_dir = Path(tempfile.mkdtemp(prefix="axis-load-"))
+    proc, base_url = start_server(data_dir, _free_port())
+    try:
+        exp, stats, elapsed = run_load(base_url, args.workers, args.duration, parse_mix(args.mix), args.seed)
+    finally:
+        proc.terminate()
+        proc.wait(timeout=20)
+
+    report(stats, elapsed)
+    problems = verify(data_dir, exp)
+    for p in problems:
+        print(p)
+    print("OK: persisted state matches acknowledged writes" if not problems else f"FAILED: {len(problems)} problem(s)")
+    if args.keep_data:
+        print(f"data: {data_dir}")
+    else:
+        shutil.rmtree(data_dir, ignore_errors=True)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,18 +1,175 @@
 # backend/main.py (FULL UPDATED) — adds Journal MVP endpoints + persistent storage
 from __future__ import annotations
 
+import copy
+import gzip
+import hashlib
 import json
+import logging
+import math
 import os
+import asyncio
+import re
+import threading
+import time
+import urllib.error
+import urllib.request
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Optional, Literal
 from uuid import uuid4
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, Header, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
 from pydantic import BaseModel
 
-app = FastAPI(title="Axis API")
+import backup
+from mutation_log import MutationLog
+
+try:  # optional: brotli is only used when installed
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Background daemon threads; the start_* functions are defined further down.
+    start_backups()
+    start_checkpoints()
+    start_replication()
+    yield
+
+
+app = FastAPI(title="Axis API", lifespan=lifespan)
+
+
+# -------------------------------------------------------------------
+# Admission control (per-class concurrency limits + bounded queues)
+# -------------------------------------------------------------------
+# One shared CPU: keep cheap mutations from queueing behind heavy journal work.
+# When a class's queue is full (or the wait times out) we shed load with
+# 503 + Retry-After instead of letting latency grow without bound.
+ADMIT_QUEUE_TIMEOUT_SEC = float(os.getenv("ADMIT_QUEUE_TIMEOUT_SEC", "10"))
+ADMIT_RETRY_AFTER_SEC = int(os.getenv("ADMIT_RETRY_AFTER_SEC", "1"))
+
+
+class AdmissionGate:
+    def __init__(self, name: str, limit: int, queue_max: int) -> None:
+        self.name = name
+        self.limit = limit
+        self.queue_max = queue_max
+        self._sem = asyncio.Semaphore(limit)
+        self.in_flight = 0
+        self.queued = 0
+        self.admitted = 0
+        self.rejected = 0
+
+    async def enter(self) -> bool:
+        if self._sem.locked() and self.queued >= self.queue_max:
+            self.rejected += 1
+            return False
+        self.queued += 1
+        try:
+            await asyncio.wait_for(self._sem.acquire(), timeout=ADMIT_QUEUE_TIMEOUT_SEC)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            return False
+        finally:
+            self.queued -= 1
+        self.in_flight += 1
+        self.admitted += 1
+        return True
+
+    def leave(self) -> None:
+        self.in_flight -= 1
+        self._sem.release()
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "queue_max": self.queue_max,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }
+
+
+ADMISSION_GATES = {
+    "mutation": AdmissionGate(
+        "mutation",
+        int(os.getenv("ADMIT_MUTATION_LIMIT", "4")),
+        int(os.getenv("ADMIT_MUTATION_QUEUE", "64")),
+    ),
+    "view": AdmissionGate(
+        "view",
+        int(os.getenv("ADMIT_VIEW_LIMIT", "4")),
+        int(os.getenv("ADMIT_VIEW_QUEUE", "32")),
+    ),
+    "heavy": AdmissionGate(
+        "heavy",
+        int(os.getenv("ADMIT_HEAVY_LIMIT", "2")),
+        int(os.getenv("ADMIT_HEAVY_QUEUE", "8")),
+    ),
+}
+
+
+def request_class(method: str, path: str, query: bytes = b"") -> Optional[str]:
+    """Map a request to an admission class; None = not throttled."""
+    if not path.startswith("/api/") or path == "/api/v1/metrics":
+        return None
+    if path.startswith("/api/v1/replication/"):
+        return None
+    if path == "/api/v1/journal/timeline":
+        return "view"
+    if path.startswith("/api/v1/journal") or "/export" in path or b"as_of=" in query:
+        return "heavy"
+    if method in ("GET", "HEAD"):
+        return "view"
+    return "mutation"
+
+
+class AdmissionControlMiddleware:
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if replica_rejects(scope["method"], scope["path"]):
+            response = JSONResponse({"detail": "read-only replica"}, status_code=503)
+            await response(scope, receive, send)
+            return
+        gate = ADMISSION_GATES.get(
+            request_class(scope["method"], scope["path"], scope.get("query_string", b""))
+        )
+        if gate is None:
+            await self.app(scope, receive, send)
+            return
+        if not await gate.enter():
+            response = JSONResponse(
+                {"detail": f"server busy ({gate.name}), retry later"},
+                status_code=503,
+                headers={"Retry-After": str(ADMIT_RETRY_AFTER_SEC)},
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            gate.leave()
+
+
+# Added first so it sits inside CORS: 503s still carry CORS headers.
+app.add_middleware(AdmissionControlMiddleware)
 
 app.add_middleware(
     CORSMiddleware,
@@ -27,6 +184,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Responses below this size go out uncompressed (not worth the CPU).
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "500"))
+
+
+
+class NegotiatedGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware only looks for "gzip" in the header; honour q=0 as well."""
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http":
+            accept = Headers(scope=scope).get("Accept-Encoding", "")
+            if "gzip" in accept and not accepts_encoding(accept, "gzip"):
+                scope = {
+                    **scope,
+                    "headers": [(k, v) for k, v in scope["headers"] if k.lower() != b"accept-encoding"],
+                }
+        await super().__call__(scope, receive, send)
+
+
+# Generic gzip for everything else; it skips responses that already carry
+# a Content-Encoding (i.e. the pre-compressed cached bodies below).
+app.add_middleware(NegotiatedGZipMiddleware, minimum_size=COMPRESSION_MIN_SIZE)
+
 # -------------------------------------------------------------------
 # Persistence paths (MVP)
 # -------------------------------------------------------------------
@@ -40,18 +220,231 @@ PROJECTS_PATH = DATA_DIR / "projects.json"
 RESOURCES_PATH = DATA_DIR / "resources.json"
 REALITY_PATH = DATA_DIR / "reality.json"
 JOURNAL_PATH = DATA_DIR / "journal.json"
+WEEK_HISTORY_PATH = DATA_DIR / "week_history.json"
+IDEMPOTENCY_PATH = DATA_DIR / "idempotency.json"
+
+# Documents that are logged, checkpointed and shipped to replicas.
+REPLICATED_PATHS = {
+    p.name: p
+    for p in (
+        TODAY_STATE_PATH,
+        WEEK_STATE_PATH,
+        PROJECTS_PATH,
+        RESOURCES_PATH,
+        REALITY_PATH,
+        JOURNAL_PATH,
+        WEEK_HISTORY_PATH,
+        IDEMPOTENCY_PATH,
+    )
+}
 
 
 def _ensure_data_dir() -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def save_json(path: Path, data: dict) -> None:
+# Replication role. A follower (REPLICA_OF=<primary base url>) never persists its
+# own writes; it only applies records shipped from the primary's mutation log.
+# Promotion is recorded in DATA_DIR so a promoted follower stays primary across
+# restarts even while REPLICA_OF is still set in its environment.
+REPLICA_OF = os.getenv("REPLICA_OF", "").strip().rstrip("/")
+PROMOTED_MARKER_PATH = DATA_DIR / "replication_promoted"
+_PROMOTED_AT = PROMOTED_MARKER_PATH.read_text(encoding="utf-8").strip() if PROMOTED_MARKER_PATH.exists() else ""
+REPLICATION = {
+    "role": "follower" if REPLICA_OF and not _PROMOTED_AT else "primary",
+    "primary": REPLICA_OF or None,
+}
+if _PROMOTED_AT:
+    REPLICATION["promoted_at"] = _PROMOTED_AT
+
+# Sequenced log of every persisted write (see mutation_log.py).
+_ensure_data_dir()
+MUTATION_LOG = MutationLog(
+    DATA_DIR / backup.MUTATION_LOG_DIR_NAME,
+    segment_records=int(os.getenv("MUTATION_LOG_SEGMENT_RECORDS", "5000")),
+)
+
+
+# In-memory version per document (file name -> counter), bumped on every save.
+# Used as the cache key for derived payloads; never persisted.
+_DOC_VERSIONS: dict[str, int] = {}
+
+
+def doc_version(path: Path) -> int:
+    return _DOC_VERSIONS.get(path.name, 0)
+
+
+# Held for every document write; backups take it to get a consistent cut.
+STORE_LOCK = threading.RLock()
+
+
+def _write_json(path: Path, data: dict) -> None:
     _ensure_data_dir()
     tmp = path.with_suffix(".tmp")
     with tmp.open("w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
     tmp.replace(path)
+    _DOC_VERSIONS[path.name] = _DOC_VERSIONS.get(path.name, 0) + 1
+
+
+def save_json(path: Path, data: dict, op: Optional[dict] = None) -> None:
+    """
+    Persist a document and append the mutation to MUTATION_LOG.
+    `op` describes the change when shipping the whole document would be wasteful
+    (journal append/update/delete); default is a full-document "put".
+    """
+    with STORE_LOCK:
+        if REPLICATION["role"] == "follower":
+            # In-memory only (e.g. day/week rollover); the primary ships the real write.
+            _DOC_VERSIONS[path.name] = _DOC_VERSIONS.get(path.name, 0) + 1
+            return
+        _write_json(path, data)
+        MUTATION_LOG.append(
+            {"ts": _utc_now_iso(), "doc": path.name, **(op or {"op": "put", "data": data})}
+        )
+        maybe_checkpoint()
+
+
+# Checkpoints: the full state right after seq N, taken every CHECKPOINT_EVERY log
+# records. State at time T = newest checkpoint taken at or before T + replay of
+# the log records after it with ts <= T, so replay cost is bounded by the
+# checkpoint interval, not by total history (see state_as_of).
+# Checkpoints are built off the request path: writers only signal, and the
+# checkpoint thread rolls the newest checkpoint forward by replaying the log
+# (no STORE_LOCK, no re-read of live documents). Only the newest CHECKPOINT_KEEP
+# are kept, and the oldest kept one sets the log truncation point (compact_log).
+# Only the documents the dashboard is built from are checkpointed and replayed:
+# the journal (and its snapshot-carrying append records) would make every
+# checkpoint and every as_of replay grow with total journal history.
+HISTORY_DOCS = (
+    TODAY_STATE_PATH.name,
+    WEEK_STATE_PATH.name,
+    PROJECTS_PATH.name,
+    RESOURCES_PATH.name,
+    REALITY_PATH.name,
+)
+CHECKPOINT_DIR = DATA_DIR / backup.CHECKPOINT_DIR_NAME
+CHECKPOINT_EVERY = int(os.getenv("CHECKPOINT_EVERY", "500"))
+CHECKPOINT_KEEP = int(os.getenv("CHECKPOINT_KEEP", "48"))
+
+_CHECKPOINTS: list[tuple[int, int]] = []  # (epoch ms, seq), sorted
+_CHECKPOINT_LOCK = threading.Lock()  # checkpoint files + log truncation
+_CHECKPOINT_DUE = threading.Event()
+
+
+def parse_ts(value: str) -> float:
+    dt = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _checkpoint_path(ts_ms: int, seq: int) -> Path:
+    return CHECKPOINT_DIR / f"{seq:012d}_{ts_ms}.json"
+
+
+def _load_checkpoint_index() -> None:
+    CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
+    for p in CHECKPOINT_DIR.glob("*.json"):
+        seq, _, ts_ms = p.stem.partition("_")
+        if seq.isdigit() and ts_ms.isdigit():
+            _CHECKPOINTS.append((int(ts_ms), int(seq)))
+    _CHECKPOINTS.sort()
+
+
+def _read_checkpoint(ts_ms: int, seq: int) -> dict[str, dict]:
+    with _checkpoint_path(ts_ms, seq).open("r", encoding="utf-8") as f:
+        return json.load(f)["docs"]
+
+
+def _store_checkpoint(ts_ms: int, seq: int, docs: dict) -> None:
+    path = _checkpoint_path(ts_ms, seq)
+    tmp = path.with_suffix(".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        docs = {k: v for k, v in docs.items() if k in HISTORY_DOCS and v is not None}
+        json.dump({"seq": seq, "docs": docs}, f, ensure_ascii=False)
+    tmp.replace(path)
+    insort(_CHECKPOINTS, (ts_ms, seq))
+    while len(_CHECKPOINTS) > max(1, CHECKPOINT_KEEP):
+        old_ts_ms, old_seq = _CHECKPOINTS.pop(0)
+        _checkpoint_path(old_ts_ms, old_seq).unlink(missing_ok=True)
+    compact_log()
+
+
+def apply_log_record(docs: dict[str, dict], record: dict) -> None:
+    # HISTORY_DOCS are only ever written as full-document puts.
+    if record.get("doc") in HISTORY_DOCS and record.get("op") == "put":
+        docs[record["doc"]] = record["data"]
+
+
+def write_checkpoint() -> None:
+    """
+    Checkpoint from the files on disk (disk == logged state). Caller holds
+    STORE_LOCK; only used at startup and after a replica re-bootstrap.
+    """
+    with _CHECKPOINT_LOCK:
+        docs = {name: load_json_or_none(REPLICATED_PATHS[name]) for name in HISTORY_DOCS}
+        _store_checkpoint(int(time.time() * 1000), MUTATION_LOG.last_seq, docs)
+
+
+def roll_checkpoint() -> None:
+    """New checkpoint at the current last_seq = newest checkpoint + log replay."""
+    with _CHECKPOINT_LOCK:
+        if not _CHECKPOINTS:
+            return
+        base_ts_ms, base_seq = max(_CHECKPOINTS, key=lambda c: c[1])
+        target = MUTATION_LOG.last_seq
+        if target <= base_seq:
+            return
+        # Stamped after reading target (rounded up): every record <= target is
+        # older, and later records with an earlier ts are replayed by state_as_of.
+        ts_ms = math.ceil(time.time() * 1000)
+        docs = _read_checkpoint(base_ts_ms, base_seq)
+        for record in MUTATION_LOG.iter_from(base_seq + 1, docs=HISTORY_DOCS):
+            if record["seq"] > target:
+                break
+            apply_log_record(docs, record)
+        _store_checkpoint(ts_ms, target, docs)
+
+
+def compact_log() -> None:
+    """
+    Log retention: records up to the oldest kept checkpoint are never replayed
+    again, so their segments are dropped. A follower further behind than that
+    gets 410 from /replication/log and re-bootstraps from a snapshot.
+    """
+    if _CHECKPOINTS:
+        MUTATION_LOG.truncate(min(seq for _, seq in _CHECKPOINTS) + 1)
+
+
+def maybe_checkpoint() -> None:
+    """Called after every logged write: cheap check, the checkpoint thread does the work."""
+    if CHECKPOINT_EVERY <= 0 or not _CHECKPOINTS:
+        return
+    if MUTATION_LOG.last_seq - max(seq for _, seq in _CHECKPOINTS) >= CHECKPOINT_EVERY:
+        _CHECKPOINT_DUE.set()
+
+
+def _checkpoint_loop() -> None:
+    while True:
+        _CHECKPOINT_DUE.wait()
+        _CHECKPOINT_DUE.clear()
+        try:
+            roll_checkpoint()
+        except Exception:
+            logging.getLogger("axis.checkpoint").exception("checkpoint failed")
+
+
+def reset_checkpoints() -> None:
+    """Caller holds STORE_LOCK. Old checkpoints refer to a discarded log."""
+    with _CHECKPOINT_LOCK:
+        for ts_ms, seq in _CHECKPOINTS:
+            _checkpoint_path(ts_ms, seq).unlink(missing_ok=True)
+        _CHECKPOINTS.clear()
+    write_checkpoint()
+
+
+_load_checkpoint_index()
 
 
 def load_json_or_none(path: Path) -> Optional[dict]:
@@ -79,6 +472,95 @@ def load_or_init(path: Path, default_factory) -> dict:
     return doc
 
 
+# -------------------------------------------------------------------
+# Response cache: serialized + pre-compressed bodies keyed by data version
+# -------------------------------------------------------------------
+RESPONSE_CACHE_MAX = 64
+
+_RESPONSE_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def accepts_encoding(accept_encoding: str, encoding: str) -> bool:
+    """
+    RFC 9110: `encoding` is acceptable if listed with q > 0, or covered by "*"
+    without being explicitly refused (q=0).
+    """
+    accepted = set()
+    refused = set()
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    refused.add(token)
+                    continue
+            except ValueError:
+                continue
+        accepted.add(token)
+    return encoding in accepted or ("*" in accepted and encoding not in refused)
+
+
+def _pick_encoding(accept_encoding: str) -> str:
+    """
+    Choose "br", "gzip" or "identity" from an Accept-Encoding header.
+    Brotli wins when the client accepts it and the module is installed.
+    """
+    if brotli is not None and accepts_encoding(accept_encoding, "br"):
+        return "br"
+    if accepts_encoding(accept_encoding, "gzip"):
+        return "gzip"
+    return "identity"
+
+
+def _compress(raw: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(raw)
+    return gzip.compress(raw, compresslevel=6)
+
+
+def cached_json_response(request: Request, key: tuple, version: tuple, build) -> Response:
+    """
+    Serve a JSON payload from the response cache.
+    `build()` is only called (and its result only serialized) when `version`
+    differs from the cached one; compressed variants are produced lazily per
+    encoding and kept alongside the raw bytes.
+    """
+    encoding = _pick_encoding(request.headers.get("accept-encoding", ""))
+
+    with _RESPONSE_CACHE_LOCK:
+        hit = _RESPONSE_CACHE.get(key)
+        if hit is not None and hit[0] == version:
+            _RESPONSE_CACHE.move_to_end(key)
+            raw, variants = hit[1], hit[2]
+        else:
+            hit = None
+
+    if hit is None:
+        raw = json.dumps(build(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        variants = {}
+        with _RESPONSE_CACHE_LOCK:
+            _RESPONSE_CACHE[key] = (version, raw, variants)
+            _RESPONSE_CACHE.move_to_end(key)
+            while len(_RESPONSE_CACHE) > RESPONSE_CACHE_MAX:
+                _RESPONSE_CACHE.popitem(last=False)
+
+    if encoding == "identity" or len(raw) < COMPRESSION_MIN_SIZE:
+        # GZipMiddleware adds Vary for uncompressed responses.
+        return Response(content=raw, media_type="application/json")
+
+    body = variants.get(encoding)
+    if body is None:
+        body = _compress(raw, encoding)
+        variants[encoding] = body
+    headers = {"Content-Encoding": encoding, "Vary": "Accept-Encoding"}
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 def _ensure_3_texts(values: list[str], placeholder: str = "—") -> list[str]:
     cleaned: list[str] = []
     for v in values[:3]:
@@ -112,6 +594,11 @@ def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+def current_week_id(on: Optional[date] = None) -> str:
+    iso = (on or date.today()).isocalendar()
+    return f"{iso.year}-W{iso.week:02d}"
+
+
 # -------------------------------------------------------------------
 # Defaults
 # -------------------------------------------------------------------
@@ -132,10 +619,8 @@ def _default_today_state() -> dict:
 
 
 def _default_week_state() -> dict:
-    iso = date.today().isocalendar()
-    default_week_id = f"{iso.year}-W{iso.week:02d}"
     return {
-        "week_id": default_week_id,
+        "week_id": current_week_id(),
         "mode": "OFF",  # "LOCKED IN" | "OFF"
         "outcomes": [
             {"id": "w1", "text": "Income/Career: ______"},
@@ -213,6 +698,14 @@ def _default_journal() -> dict:
     return {"entries": []}
 
 
+def _default_week_history() -> dict:
+    return {"weeks": {}}
+
+
+def _default_idempotency() -> dict:
+    return {"keys": {}}
+
+
 # -------------------------------------------------------------------
 # Normalizers (manual-first, minimal)
 # -------------------------------------------------------------------
@@ -287,13 +780,11 @@ def normalize_resources(doc: dict) -> dict:
     return {"sections": norm_sections}
 
 
-def normalize_week_state(doc: dict) -> dict:
-    iso = date.today().isocalendar()
-    default_week_id = f"{iso.year}-W{iso.week:02d}"
-
-    # Always anchor the active week to the current ISO week.
-    # Stored week_id may be stale if the app wasn't explicitly "closed week" at rollover.
-    week_id = default_week_id
+def normalize_week_state(doc: dict, on: Optional[date] = None) -> dict:
+    # Always anchor the active week to the current ISO week (or the week of `on`).
+    # Stored week_id may be stale if the app wasn't explicitly "closed week" at rollover;
+    # roll_week_state() archives the outgoing week before this overwrites it.
+    week_id = current_week_id(on)
     mode = str(doc.get("mode") or "OFF")
 
     raw_outcomes = doc.get("outcomes", [])
@@ -342,8 +833,19 @@ def normalize_week_state(doc: dict) -> dict:
     }
 
 
-def normalize_today_state(doc: dict) -> dict:
-    today = date.today().isoformat()
+def normalize_today_state(doc: dict, on: Optional[date] = None) -> dict:
+    """
+    Request-path normalizer; assumes the canonical (migrated) shape.
+    Only handles day rollover: new date, all top3 items undone.
+    """
+    today = (on or date.today()).isoformat()
+    if doc.get("date") == today:
+        return doc
+    return {**doc, "date": today, "top3": [{**it, "done": False} for it in doc["top3"]]}
+
+
+def _canonical_today_state(doc: dict) -> dict:
+    """Full legacy-aware normalization (used by the schema migration only)."""
     stored_date = str(doc.get("date") or "")
 
     top3 = doc.get("top3", None)
@@ -359,10 +861,6 @@ def normalize_today_state(doc: dict) -> dict:
     else:
         top3_items = _ensure_3_items(top3, prefix="t", placeholder="—")
 
-    if stored_date != today:
-        for it in top3_items:
-            it["done"] = False
-
     actions = doc.get("actions", [])
     blockers = doc.get("blockers", [])
     if not isinstance(actions, list):
@@ -371,7 +869,7 @@ def normalize_today_state(doc: dict) -> dict:
         blockers = []
 
     return {
-        "date": today,
+        "date": stored_date,
         "top3": top3_items,
         "outcomes": doc.get("outcomes", []) if isinstance(doc.get("outcomes", []), list) else [],
         "actions": actions,
@@ -394,14 +892,187 @@ def normalize_journal(doc: dict) -> dict:
 
 
 # -------------------------------------------------------------------
-# Load state (safe init)
+# Schema migrations (applied once at load, result persisted)
+# -------------------------------------------------------------------
+# Each document carries "schema_version" (missing = 0). MIGRATIONS[doc][v] upgrades
+# a doc from version v to v + 1. Once a stored doc is current, the request path can
+# assume canonical shape: no legacy fallbacks, no defensive copies.
+SCHEMA_VERSIONS: dict[str, int] = {
+    TODAY_STATE_PATH.name: 1,
+    WEEK_STATE_PATH.name: 1,
+    PROJECTS_PATH.name: 1,
+    RESOURCES_PATH.name: 1,
+    REALITY_PATH.name: 1,
+    JOURNAL_PATH.name: 1,
+    WEEK_HISTORY_PATH.name: 1,
+    IDEMPOTENCY_PATH.name: 1,
+}
+
+MIGRATIONS: dict[str, dict[int, object]] = {}
+
+
+def migration(path: Path, from_version: int):
+    def register(fn):
+        MIGRATIONS.setdefault(path.name, {})[from_version] = fn
+        return fn
+
+    return register
+
+
+@migration(TODAY_STATE_PATH, 0)
+def _today_v0_to_v1(doc: dict) -> dict:
+    # legacy: "outcomes" as top3 fallback, non-list actions/blockers, <3 items
+    return _canonical_today_state(doc)
+
+
+@migration(WEEK_STATE_PATH, 0)
+def _week_v0_to_v1(doc: dict) -> dict:
+    # keep the stored week_id so roll_week_state() can still archive a stale week
+    return {**normalize_week_state(doc), "week_id": str(doc.get("week_id") or current_week_id())}
+
+
+@migration(PROJECTS_PATH, 0)
+def _projects_v0_to_v1(doc: dict) -> dict:
+    return normalize_projects(doc if isinstance(doc.get("projects"), list) else {"projects": []})
+
+
+@migration(RESOURCES_PATH, 0)
+def _resources_v0_to_v1(doc: dict) -> dict:
+    return normalize_resources(doc if isinstance(doc.get("sections"), list) else {"sections": []})
+
+
+@migration(REALITY_PATH, 0)
+def _reality_v0_to_v1(doc: dict) -> dict:
+    commitments = doc.get("commitments", [])
+    if not isinstance(commitments, list):
+        commitments = []
+    return {"commitments": [c for c in commitments if isinstance(c, dict)]}
+
+
+@migration(JOURNAL_PATH, 0)
+def _journal_v0_to_v1(doc: dict) -> dict:
+    return normalize_journal(doc)
+
+
+@migration(WEEK_HISTORY_PATH, 0)
+def _week_history_v0_to_v1(doc: dict) -> dict:
+    return doc if isinstance(doc.get("weeks"), dict) else _default_week_history()
+
+
+@migration(IDEMPOTENCY_PATH, 0)
+def _idempotency_v0_to_v1(doc: dict) -> dict:
+    return doc if isinstance(doc.get("keys"), dict) else _default_idempotency()
+
+
+def migrate_document(path: Path, doc: dict) -> tuple[dict, bool]:
+    """Upgrade `doc` to the current schema version. Returns (doc, changed)."""
+    target = SCHEMA_VERSIONS[path.name]
+    version = doc.get("schema_version", 0)
+    if not isinstance(version, int) or version < 0:
+        version = 0
+    if version > target:
+        raise RuntimeError(f"{path.name}: schema_version {version} is newer than this build ({target})")
+    changed = False
+    while version < target:
+        doc = MIGRATIONS[path.name][version](doc)
+        version += 1
+        doc["schema_version"] = version
+        changed = True
+    return doc, changed
+
+
+def public_view(doc: dict) -> dict:
+    """API shape of a stored document: schema_version is a storage detail."""
+    return {k: v for k, v in doc.items() if k != "schema_version"}
+
+
+def load_document(path: Path, default_factory) -> dict:
+    doc, changed = migrate_document(path, load_or_init(path, default_factory))
+    if changed:
+        save_json(path, doc)
+    return doc
+
+
+# -------------------------------------------------------------------
+# Load state (safe init + migrate)
+# -------------------------------------------------------------------
+TODAY_STATE = normalize_today_state(load_document(TODAY_STATE_PATH, _default_today_state))
+WEEK_STATE = load_document(WEEK_STATE_PATH, _default_week_state)  # rolled by roll_week_state()
+PROJECTS = load_document(PROJECTS_PATH, _default_projects)
+RESOURCES = load_document(RESOURCES_PATH, _default_resources)
+REALITY = load_document(REALITY_PATH, _default_reality)
+JOURNAL = load_document(JOURNAL_PATH, _default_journal)
+WEEK_HISTORY = load_document(WEEK_HISTORY_PATH, _default_week_history)
+IDEMPOTENCY = load_document(IDEMPOTENCY_PATH, _default_idempotency)
+
+
+# -------------------------------------------------------------------
+# Week history (archived WEEK_STATE per week_id)
 # -------------------------------------------------------------------
-TODAY_STATE = normalize_today_state(load_or_init(TODAY_STATE_PATH, _default_today_state))
-WEEK_STATE = normalize_week_state(load_or_init(WEEK_STATE_PATH, _default_week_state))
-PROJECTS = normalize_projects(load_or_init(PROJECTS_PATH, _default_projects))
-RESOURCES = normalize_resources(load_or_init(RESOURCES_PATH, _default_resources))
-REALITY = load_or_init(REALITY_PATH, _default_reality)
-JOURNAL = normalize_journal(load_or_init(JOURNAL_PATH, _default_journal))
+# WEEK_HISTORY["weeks"] maps week_id -> record; _WEEK_IDS is the same key set kept
+# sorted ("YYYY-Www" sorts chronologically) so range queries are a bisect + slice.
+WEEK_ID_RE = re.compile(r"^\d{4}-W\d{2}$")
+
+_WEEK_IDS: list[str] = sorted(WEEK_HISTORY["weeks"])
+
+
+def _week_record(state: dict, week_id: str) -> dict:
+    projects = PROJECTS.get("projects", [])
+    active = [p for p in projects if p.get("is_active") is True][:3]
+    return {
+        "week_id": week_id,
+        "archived_at": _utc_now_iso(),
+        "mode": state.get("mode", "OFF"),
+        "outcomes": state.get("outcomes", [])[:3],
+        "blockers": state.get("blockers", [])[:3],
+        "anchors": state.get("anchors", {}),
+        "active_projects": [
+            {"key": p.get("key"), "name": p.get("name"), "links": copy.deepcopy(p.get("links", []))}
+            for p in active
+        ],
+    }
+
+
+def archive_week(state: dict, week_id: str) -> dict:
+    with STORE_LOCK:
+        weeks = WEEK_HISTORY["weeks"]
+        if week_id not in weeks:
+            insort(_WEEK_IDS, week_id)
+        record = _week_record(normalize_week_state(state), week_id)
+        weeks[week_id] = record
+        save_json(WEEK_HISTORY_PATH, WEEK_HISTORY)
+        return record
+
+
+def roll_week_state() -> None:
+    """
+    If WEEK_STATE's week_id is stale (ISO week rolled over), archive the outgoing
+    week under its own id, then persist the rolled-over state. WEEK_STATE is
+    canonical after migration, so the common case is a single comparison.
+    """
+    global WEEK_STATE
+    if WEEK_STATE.get("week_id") == current_week_id():
+        return
+    with STORE_LOCK:
+        # Re-check: a concurrent request may have rolled over while we waited.
+        prev_week_id = str(WEEK_STATE.get("week_id") or "")
+        if prev_week_id == current_week_id():
+            return
+        if WEEK_ID_RE.match(prev_week_id):
+            archive_week(WEEK_STATE, prev_week_id)
+        WEEK_STATE = {**normalize_week_state(WEEK_STATE), "schema_version": SCHEMA_VERSIONS[WEEK_STATE_PATH.name]}
+        save_json(WEEK_STATE_PATH, WEEK_STATE)
+
+
+def week_history_range(start: Optional[str], end: Optional[str], limit: int) -> list[dict]:
+    """Archived weeks with start <= week_id <= end, oldest first."""
+    lo = bisect_left(_WEEK_IDS, start) if start else 0
+    hi = bisect_right(_WEEK_IDS, end) if end else len(_WEEK_IDS)
+    weeks = WEEK_HISTORY["weeks"]
+    return [weeks[w] for w in _WEEK_IDS[lo : min(hi, lo + limit)]]
+
+
+roll_week_state()
 
 
 def _snapshot_now() -> dict:
@@ -409,15 +1080,17 @@ def _snapshot_now() -> dict:
     Snapshot current state for journal entries.
     Keep it compact; frontend can render collapsible sections.
     """
-    global TODAY_STATE, WEEK_STATE
+    global TODAY_STATE
 
     TODAY_STATE = normalize_today_state(TODAY_STATE)
-    WEEK_STATE = normalize_week_state(WEEK_STATE)
+    roll_week_state()
 
+    # Deep copy: live documents are edited in place (toggles, granular project ops),
+    # and a journal entry must keep the state it was written with.
     projects = PROJECTS.get("projects", [])
     active = [p for p in projects if p.get("is_active") is True][:3]
 
-    return {
+    return copy.deepcopy({
         "today": {
             "date": TODAY_STATE.get("date"),
             "top3": TODAY_STATE.get("top3", [])[:3],
@@ -438,9 +1111,273 @@ def _snapshot_now() -> dict:
             ],
         },
         "projects": projects,
+    })
+
+
+# -------------------------------------------------------------------
+# Backups (periodic, incremental; see backup.py for the restore CLI)
+# -------------------------------------------------------------------
+BACKUP_DIR = Path(os.getenv("BACKUP_DIR", str(DATA_DIR / "backups")))
+BACKUP_INTERVAL_SEC = int(os.getenv("BACKUP_INTERVAL_SEC", "3600"))  # 0 disables
+BACKUP_KEEP = int(os.getenv("BACKUP_KEEP", "24"))
+
+
+def run_backup() -> Path:
+    snap = backup.take_snapshot(DATA_DIR, BACKUP_DIR, lock=STORE_LOCK)
+    backup.prune_snapshots(BACKUP_DIR, BACKUP_KEEP)
+    return snap
+
+
+def _backup_loop() -> None:
+    while True:
+        time.sleep(BACKUP_INTERVAL_SEC)
+        try:
+            run_backup()
+        except Exception:
+            # Never let a failed backup take the API down.
+            logging.getLogger("axis.backup").exception("backup failed")
+
+
+def start_backups() -> None:
+    if BACKUP_INTERVAL_SEC > 0:
+        threading.Thread(target=_backup_loop, name="axis-backup", daemon=True).start()
+
+
+# -------------------------------------------------------------------
+# Replication (log shipping to a warm standby)
+# -------------------------------------------------------------------
+# Primary: serves its mutation log (+ a consistent full snapshot for bootstrap).
+# Follower: polls the log, applies records with the primary's seq, serves GETs,
+# rejects writes, and can be promoted to primary.
+REPLICATION_TOKEN = os.getenv("REPLICATION_TOKEN", "")
+REPLICA_POLL_SEC = float(os.getenv("REPLICA_POLL_SEC", "1"))
+
+def replica_rejects(method: str, path: str) -> bool:
+    return (
+        REPLICATION["role"] == "follower"
+        and method not in ("GET", "HEAD", "OPTIONS")
+        and path.startswith("/api/")
+        and not path.startswith("/api/v1/replication/")
+    )
+
+
+def _check_replication_token(token: Optional[str]) -> None:
+    if REPLICATION_TOKEN and token != REPLICATION_TOKEN:
+        raise HTTPException(status_code=403, detail="invalid replication token")
+
+
+def _install_doc(name: str, data: dict) -> None:
+    global TODAY_STATE, WEEK_STATE, PROJECTS, RESOURCES, REALITY, JOURNAL, WEEK_HISTORY, IDEMPOTENCY
+    if name == TODAY_STATE_PATH.name:
+        TODAY_STATE = data
+    elif name == WEEK_STATE_PATH.name:
+        WEEK_STATE = data
+    elif name == PROJECTS_PATH.name:
+        PROJECTS = data
+    elif name == RESOURCES_PATH.name:
+        RESOURCES = data
+    elif name == REALITY_PATH.name:
+        REALITY = data
+    elif name == JOURNAL_PATH.name:
+        JOURNAL = data
+        rebuild_timeline()
+    elif name == WEEK_HISTORY_PATH.name:
+        WEEK_HISTORY = data
+        _WEEK_IDS[:] = sorted(data.get("weeks", {}))
+    elif name == IDEMPOTENCY_PATH.name:
+        IDEMPOTENCY = data
+
+
+def apply_journal_op(doc: dict, record: dict) -> dict:
+    """
+    Apply an append/update/delete journal record to `doc` in place. Idempotent:
+    a follower that crashed between writing the doc and logging the record
+    re-applies it on restart, so an already present append is skipped.
+    """
+    entries = doc.setdefault("entries", [])
+    op = record.get("op")
+    if op == "append":
+        if _find_entry_index(entries, record["entry"].get("id")) == -1:
+            entries.append(record["entry"])
+    elif op == "update":
+        idx = _find_entry_index(entries, record["entry"].get("id"))
+        if idx != -1:
+            entries[idx] = record["entry"]
+    elif op == "delete":
+        idx = _find_entry_index(entries, record.get("id"))
+        if idx != -1:
+            entries.pop(idx)
+    return doc
+
+
+def apply_replicated(record: dict) -> None:
+    name = record.get("doc")
+    if name not in REPLICATED_PATHS:
+        return
+    with STORE_LOCK:
+        if record.get("op") == "put":
+            data = record["data"]
+            _install_doc(name, data)
+        else:
+            data = apply_journal_op(JOURNAL, record)
+            timeline_apply(record)
+        _write_json(REPLICATED_PATHS[name], data)
+        MUTATION_LOG.append(record)
+        maybe_checkpoint()
+
+
+def install_snapshot(snapshot: dict) -> None:
+    with STORE_LOCK:
+        for name, data in snapshot.get("docs", {}).items():
+            if name in REPLICATED_PATHS and isinstance(data, dict):
+                _install_doc(name, data)
+                _write_json(REPLICATED_PATHS[name], data)
+        MUTATION_LOG.reset(int(snapshot["seq"]))
+        reset_checkpoints()
+
+
+def _fetch_primary(path: str) -> dict:
+    req = urllib.request.Request(REPLICATION["primary"] + path)
+    if REPLICATION_TOKEN:
+        req.add_header("X-Replication-Token", REPLICATION_TOKEN)
+    with urllib.request.urlopen(req, timeout=30) as res:
+        return json.loads(res.read().decode("utf-8"))
+
+
+def _follow_primary() -> None:
+    # A fresh follower (empty log) or one that fell behind the primary's retained
+    # log bootstraps from a snapshot; otherwise it resumes from its own last_seq.
+    needs_snapshot = MUTATION_LOG.last_seq == 0
+    while REPLICATION["role"] == "follower":
+        try:
+            if needs_snapshot:
+                install_snapshot(_fetch_primary("/api/v1/replication/snapshot"))
+                needs_snapshot = False
+            try:
+                batch = _fetch_primary(
+                    f"/api/v1/replication/log?since={MUTATION_LOG.last_seq}&limit=500"
+                )
+            except urllib.error.HTTPError as e:
+                if e.code == 410:
+                    needs_snapshot = True
+                    continue
+                raise
+            for record in batch.get("records", []):
+                if REPLICATION["role"] != "follower":
+                    break
+                apply_replicated(record)
+            REPLICATION["primary_seq"] = batch.get("last_seq")
+            REPLICATION["last_contact"] = _utc_now_iso()
+            REPLICATION["last_error"] = None
+            if not batch.get("records"):
+                time.sleep(REPLICA_POLL_SEC)
+        except Exception as e:
+            REPLICATION["last_error"] = str(e)
+            time.sleep(REPLICA_POLL_SEC)
+
+
+# -------------------------------------------------------------------
+# History: time-travel views (checkpoint + log replay)
+# -------------------------------------------------------------------
+def state_as_of(ts: float) -> dict[str, dict]:
+    ts_ms = int(ts * 1000)
+    # Held so the checkpoint (and the log after it) cannot be pruned mid-replay.
+    with _CHECKPOINT_LOCK:
+        idx = bisect_right(_CHECKPOINTS, (ts_ms, float("inf"))) - 1
+        if idx < 0:
+            raise HTTPException(status_code=404, detail="no history recorded before as_of")
+        cp_ts_ms, cp_seq = _CHECKPOINTS[idx]
+        docs = _read_checkpoint(cp_ts_ms, cp_seq)
+        for record in MUTATION_LOG.iter_from(cp_seq + 1, docs=HISTORY_DOCS):
+            if parse_ts(record["ts"]) > ts:
+                break
+            apply_log_record(docs, record)
+    return docs
+
+
+def dashboard_as_of(ts: float) -> dict:
+    docs = state_as_of(ts)
+    day = datetime.fromtimestamp(ts, timezone.utc).date()
+    today = normalize_today_state(docs.get(TODAY_STATE_PATH.name) or _default_today_state(), on=day)
+    week = docs.get(WEEK_STATE_PATH.name) or _default_week_state()
+    if week.get("week_id") != current_week_id(day):
+        week = normalize_week_state(week, on=day)
+    payload = build_dashboard_payload(
+        today,
+        week,
+        docs.get(PROJECTS_PATH.name) or {"projects": []},
+        docs.get(RESOURCES_PATH.name) or {"sections": []},
+        docs.get(REALITY_PATH.name) or {"commitments": []},
+    )
+    payload["as_of"] = datetime.fromtimestamp(ts, timezone.utc).isoformat().replace("+00:00", "Z")
+    return payload
+
+
+if not _CHECKPOINTS:
+    with STORE_LOCK:
+        write_checkpoint()
+
+
+def start_checkpoints() -> None:
+    threading.Thread(target=_checkpoint_loop, name="axis-checkpoint", daemon=True).start()
+    maybe_checkpoint()  # catch up on writes logged before a restart
+
+
+def start_replication() -> None:
+    if REPLICATION["role"] == "follower":
+        threading.Thread(target=_follow_primary, name="axis-replica", daemon=True).start()
+
+
+@app.get("/api/v1/replication/status")
+def replication_status():
+    return {
+        **REPLICATION,
+        "last_seq": MUTATION_LOG.last_seq,
+        "first_seq": MUTATION_LOG.first_seq,
     }
 
 
+@app.get("/api/v1/replication/log")
+def replication_log(
+    since: int = Query(0, ge=0),
+    limit: int = Query(500, ge=1, le=5000),
+    x_replication_token: Optional[str] = Header(None, alias="X-Replication-Token"),
+):
+    _check_replication_token(x_replication_token)
+    if since < MUTATION_LOG.first_seq - 1:
+        raise HTTPException(status_code=410, detail="log truncated; fetch a snapshot")
+    return {"records": MUTATION_LOG.read_since(since, limit), "last_seq": MUTATION_LOG.last_seq}
+
+
+@app.get("/api/v1/replication/snapshot")
+def replication_snapshot(
+    x_replication_token: Optional[str] = Header(None, alias="X-Replication-Token"),
+):
+    _check_replication_token(x_replication_token)
+    with STORE_LOCK:
+        return {
+            "seq": MUTATION_LOG.last_seq,
+            "docs": {name: load_json_or_none(path) for name, path in REPLICATED_PATHS.items()},
+        }
+
+
+@app.post("/api/v1/replication/promote")
+def replication_promote(
+    x_replication_token: Optional[str] = Header(None, alias="X-Replication-Token"),
+):
+    _check_replication_token(x_replication_token)
+    if REPLICATION["role"] != "follower":
+        raise HTTPException(status_code=409, detail="already primary")
+    with STORE_LOCK:
+        promoted_at = _utc_now_iso()
+        tmp = PROMOTED_MARKER_PATH.with_suffix(".tmp")
+        tmp.write_text(promoted_at + "\n", encoding="utf-8")
+        tmp.replace(PROMOTED_MARKER_PATH)
+        REPLICATION["role"] = "primary"
+        REPLICATION["promoted_at"] = promoted_at
+    return replication_status()
+
+
 # -------------------------------------------------------------------
 # Health + Auth
 # -------------------------------------------------------------------
@@ -449,6 +1386,14 @@ def health():
     return {"ok": True}
 
 
+@app.get("/api/v1/metrics")
+def metrics():
+    return {
+        "admission": {name: gate.stats() for name, gate in ADMISSION_GATES.items()},
+        "response_cache": {"entries": len(_RESPONSE_CACHE), "max": RESPONSE_CACHE_MAX},
+    }
+
+
 @app.get("/api/v1/auth/me")
 def me():
     return {"id": "user_1", "name": "RM", "role": "primary"}
@@ -457,13 +1402,16 @@ def me():
 # -------------------------------------------------------------------
 # Projects / Resources (editable)
 # -------------------------------------------------------------------
+MAX_ACTIVE_PROJECTS = 3
+
+
 class ProjectsDoc(BaseModel):
     projects: list[dict]
 
 
 @app.get("/api/v1/projects")
 def get_projects():
-    return PROJECTS
+    return public_view(PROJECTS)
 
 
 @app.put("/api/v1/projects")
@@ -475,12 +1423,131 @@ def put_projects(payload: ProjectsDoc):
         raise HTTPException(status_code=400, detail=str(e))
 
     active_count = sum(1 for p in normalized["projects"] if p.get("is_active"))
-    if active_count > 3:
+    if active_count > MAX_ACTIVE_PROJECTS:
         raise HTTPException(status_code=400, detail="Max 3 active projects allowed")
 
-    PROJECTS = normalized
-    save_json(PROJECTS_PATH, PROJECTS)
-    return PROJECTS
+    with STORE_LOCK:
+        PROJECTS = {**normalized, "schema_version": SCHEMA_VERSIONS[PROJECTS_PATH.name]}
+        save_json(PROJECTS_PATH, PROJECTS)
+    return public_view(PROJECTS)
+
+
+# -------------------------------------------------------------------
+# Projects: granular ops (delta only, no full-document round-trip)
+# -------------------------------------------------------------------
+class ProjectPatch(BaseModel):
+    name: Optional[str] = None
+    is_active: Optional[bool] = None
+    focus: Optional[str] = None
+
+
+class LinkIn(BaseModel):
+    label: str
+    url: str
+    index: Optional[int] = None
+
+
+class LinkPatch(BaseModel):
+    label: Optional[str] = None
+    url: Optional[str] = None
+    to_index: Optional[int] = None
+
+
+def _clean_link(label: Optional[str], url: Optional[str]) -> dict:
+    label = str(label or "").strip()
+    url = str(url or "").strip()
+    if not label or not url:
+        raise HTTPException(status_code=400, detail="link label and url are required")
+    return {"label": label, "url": url}
+
+
+def _find_project(key: str) -> dict:
+    for p in PROJECTS.get("projects", []):
+        if p.get("key") == key:
+            return p
+    raise HTTPException(status_code=404, detail="project not found")
+
+
+def _link_at(links: list[dict], index: int) -> dict:
+    if index < 0 or index >= len(links):
+        raise HTTPException(status_code=404, detail="link not found")
+    return links[index]
+
+
+def _apply_link_patch(links: list[dict], index: int, patch: LinkPatch) -> None:
+    current = _link_at(links, index)
+    updated = _clean_link(
+        patch.label if patch.label is not None else current.get("label"),
+        patch.url if patch.url is not None else current.get("url"),
+    )
+    links[index] = updated
+    if patch.to_index is not None:
+        to_index = max(0, min(patch.to_index, len(links) - 1))
+        links.insert(to_index, links.pop(index))
+
+
+def _insert_link(links: list[dict], payload: LinkIn) -> None:
+    link = _clean_link(payload.label, payload.url)
+    if payload.index is None:
+        links.append(link)
+    else:
+        links.insert(max(0, min(payload.index, len(links))), link)
+
+
+@app.patch("/api/v1/projects/{key}")
+def patch_project(key: str, payload: ProjectPatch):
+    # Count + apply + save under one lock: concurrent activations must not both
+    # see a free slot.
+    with STORE_LOCK:
+        project = _find_project(key)
+
+        if payload.is_active is True and not project.get("is_active"):
+            # Only an inactive -> active transition can break the cap.
+            active_count = sum(1 for p in PROJECTS.get("projects", []) if p.get("is_active"))
+            if active_count >= MAX_ACTIVE_PROJECTS:
+                raise HTTPException(status_code=400, detail="Max 3 active projects allowed")
+
+        if payload.name is not None:
+            name = str(payload.name).strip()
+            if not name:
+                raise HTTPException(status_code=400, detail="project name cannot be empty")
+            project["name"] = name
+        if payload.is_active is not None:
+            project["is_active"] = payload.is_active
+        if payload.focus is not None:
+            project["focus"] = str(payload.focus).strip()
+
+        save_json(PROJECTS_PATH, PROJECTS)
+        return project
+
+
+@app.post("/api/v1/projects/{key}/links")
+def add_project_link(key: str, payload: LinkIn):
+    with STORE_LOCK:
+        project = _find_project(key)
+        _insert_link(project.setdefault("links", []), payload)
+        save_json(PROJECTS_PATH, PROJECTS)
+        return project
+
+
+@app.patch("/api/v1/projects/{key}/links/{index}")
+def patch_project_link(key: str, index: int, payload: LinkPatch):
+    with STORE_LOCK:
+        project = _find_project(key)
+        _apply_link_patch(project.setdefault("links", []), index, payload)
+        save_json(PROJECTS_PATH, PROJECTS)
+        return project
+
+
+@app.delete("/api/v1/projects/{key}/links/{index}")
+def delete_project_link(key: str, index: int):
+    with STORE_LOCK:
+        project = _find_project(key)
+        links = project.setdefault("links", [])
+        _link_at(links, index)
+        links.pop(index)
+        save_json(PROJECTS_PATH, PROJECTS)
+        return project
 
 
 class ResourcesDoc(BaseModel):
@@ -489,7 +1556,7 @@ class ResourcesDoc(BaseModel):
 
 @app.get("/api/v1/resources")
 def get_resources():
-    return RESOURCES
+    return public_view(RESOURCES)
 
 
 @app.put("/api/v1/resources")
@@ -500,9 +1567,73 @@ def put_resources(payload: ResourcesDoc):
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    RESOURCES = normalized
-    save_json(RESOURCES_PATH, RESOURCES)
-    return RESOURCES
+    with STORE_LOCK:
+        RESOURCES = {**normalized, "schema_version": SCHEMA_VERSIONS[RESOURCES_PATH.name]}
+        save_json(RESOURCES_PATH, RESOURCES)
+    return public_view(RESOURCES)
+
+
+# -------------------------------------------------------------------
+# Resources: granular ops (sections addressed by position)
+# -------------------------------------------------------------------
+class SectionPatch(BaseModel):
+    title: Optional[str] = None
+    to_index: Optional[int] = None
+
+
+def _section_at(index: int) -> dict:
+    sections = RESOURCES.get("sections", [])
+    if index < 0 or index >= len(sections):
+        raise HTTPException(status_code=404, detail="section not found")
+    return sections[index]
+
+
+@app.patch("/api/v1/resources/sections/{index}")
+def patch_resource_section(index: int, payload: SectionPatch):
+    with STORE_LOCK:
+        section = _section_at(index)
+
+        if payload.title is not None:
+            title = str(payload.title).strip()
+            if not title:
+                raise HTTPException(status_code=400, detail="section title cannot be empty")
+            section["title"] = title
+        if payload.to_index is not None:
+            sections = RESOURCES["sections"]
+            to_index = max(0, min(payload.to_index, len(sections) - 1))
+            sections.insert(to_index, sections.pop(index))
+
+        save_json(RESOURCES_PATH, RESOURCES)
+        return section
+
+
+@app.post("/api/v1/resources/sections/{index}/links")
+def add_resource_link(index: int, payload: LinkIn):
+    with STORE_LOCK:
+        section = _section_at(index)
+        _insert_link(section.setdefault("links", []), payload)
+        save_json(RESOURCES_PATH, RESOURCES)
+        return section
+
+
+@app.patch("/api/v1/resources/sections/{index}/links/{link_index}")
+def patch_resource_link(index: int, link_index: int, payload: LinkPatch):
+    with STORE_LOCK:
+        section = _section_at(index)
+        _apply_link_patch(section.setdefault("links", []), link_index, payload)
+        save_json(RESOURCES_PATH, RESOURCES)
+        return section
+
+
+@app.delete("/api/v1/resources/sections/{index}/links/{link_index}")
+def delete_resource_link(index: int, link_index: int):
+    with STORE_LOCK:
+        section = _section_at(index)
+        links = section.setdefault("links", [])
+        _link_at(links, link_index)
+        links.pop(link_index)
+        save_json(RESOURCES_PATH, RESOURCES)
+        return section
 
 
 # -------------------------------------------------------------------
@@ -514,7 +1645,7 @@ class WeekOutcomesPut(BaseModel):
 
 @app.put("/api/v1/week/outcomes")
 def put_week_outcomes(payload: WeekOutcomesPut):
-    global WEEK_STATE
+    roll_week_state()
     texts = _ensure_3_texts(payload.outcomes, placeholder="—")
     WEEK_STATE["outcomes"] = [
         {"id": "w1", "text": texts[0]},
@@ -522,7 +1653,7 @@ def put_week_outcomes(payload: WeekOutcomesPut):
         {"id": "w3", "text": texts[2]},
     ]
     save_json(WEEK_STATE_PATH, WEEK_STATE)
-    return WEEK_STATE
+    return public_view(WEEK_STATE)
 
 
 class WeekBlockersPut(BaseModel):
@@ -531,7 +1662,7 @@ class WeekBlockersPut(BaseModel):
 
 @app.put("/api/v1/week/blockers")
 def put_week_blockers(payload: WeekBlockersPut):
-    global WEEK_STATE
+    roll_week_state()
     texts = _ensure_3_texts(payload.blockers, placeholder="—")
     WEEK_STATE["blockers"] = [
         {"id": "b1", "text": texts[0]},
@@ -539,7 +1670,42 @@ def put_week_blockers(payload: WeekBlockersPut):
         {"id": "b3", "text": texts[2]},
     ]
     save_json(WEEK_STATE_PATH, WEEK_STATE)
-    return WEEK_STATE
+    return public_view(WEEK_STATE)
+
+
+# -------------------------------------------------------------------
+# Week history (read-only)
+# -------------------------------------------------------------------
+def _check_week_id(week_id: str) -> str:
+    if not WEEK_ID_RE.match(week_id):
+        raise HTTPException(status_code=400, detail="week_id must be YYYY-Www")
+    return week_id
+
+
+@app.get("/api/v1/weeks")
+def list_weeks(
+    start: Optional[str] = Query(None, alias="from"),
+    end: Optional[str] = Query(None, alias="to"),
+    limit: int = Query(52, ge=1, le=520),
+):
+    if start:
+        _check_week_id(start)
+    if end:
+        _check_week_id(end)
+    roll_week_state()  # archive the week that just ended before listing
+    return {"weeks": week_history_range(start, end, limit), "from": start, "to": end, "limit": limit}
+
+
+@app.get("/api/v1/weeks/{week_id}")
+def get_week(week_id: str):
+    _check_week_id(week_id)
+    record = WEEK_HISTORY["weeks"].get(week_id)
+    if record is not None:
+        return record
+    if week_id == current_week_id():
+        roll_week_state()
+        return {**_week_record(WEEK_STATE, week_id), "archived_at": None}
+    raise HTTPException(status_code=404, detail="week not found")
 
 
 # -------------------------------------------------------------------
@@ -561,7 +1727,7 @@ def put_today_top3(payload: TodayTop3Put):
         {"id": "t3", "text": texts[2], "done": False},
     ]
     save_json(TODAY_STATE_PATH, TODAY_STATE)
-    return TODAY_STATE
+    return public_view(TODAY_STATE)
 
 
 class ToggleDone(BaseModel):
@@ -621,12 +1787,14 @@ class WeeklyReviewPatch(BaseModel):
 
 
 def _append_journal_entry(entry: dict) -> dict:
-    global JOURNAL
-    JOURNAL = normalize_journal(JOURNAL)
-    entries = JOURNAL.get("entries", [])
-    entries.append(entry)
-    JOURNAL["entries"] = entries
-    save_json(JOURNAL_PATH, JOURNAL)
+    op = {"op": "append", "entry": entry}
+    # Mutate + log under one lock, so log order == list order (replicas, as_of).
+    with STORE_LOCK:
+        entries = JOURNAL.get("entries", [])
+        entries.append(entry)
+        JOURNAL["entries"] = entries
+        timeline_apply(op)
+        save_json(JOURNAL_PATH, JOURNAL, op=op)
     return entry
 
 def _clean_wins(wins: list[str]) -> list[str]:
@@ -642,23 +1810,102 @@ def _find_entry_index(entries: list[dict], entry_id: str) -> int:
 
 @app.get("/api/v1/journal")
 def list_journal(
+    request: Request,
     limit: int = Query(50, ge=1, le=200),
     type: Optional[JournalType] = Query(None),
 ):
-    global JOURNAL
-    JOURNAL = normalize_journal(JOURNAL)
-    entries = JOURNAL.get("entries", [])
 
-    if type:
-        entries = [e for e in entries if e.get("type") == type]
+    def build() -> dict:
+        entries = JOURNAL.get("entries", [])
+        if type:
+            entries = [e for e in entries if e.get("type") == type]
+        # newest first
+        entries = list(reversed(entries))[:limit]
+        return {"entries": entries, "limit": limit, "type": type}
+
+    return cached_json_response(
+        request,
+        key=("journal", limit, type),
+        version=(doc_version(JOURNAL_PATH),),
+        build=build,
+    )
+
+
+# -------------------------------------------------------------------
+# Idempotency keys for journal creation
+# -------------------------------------------------------------------
+# IDEMPOTENCY["keys"]: "<kind>:<Idempotency-Key>" -> {"entry_id", "body", "ts"},
+# oldest first; "body" is a hash of the request payload. Reusing a key with a
+# different payload is a 422.
+# Only the entry id is stored, not the response: a replay returns the entry as it
+# is now in JOURNAL (including later PATCHes), so the cache stays tiny and
+# snapshots are not persisted (or logged) twice.
+IDEMPOTENCY_TTL_SEC = int(os.getenv("IDEMPOTENCY_TTL_SEC", str(24 * 3600)))
+IDEMPOTENCY_MAX_KEYS = int(os.getenv("IDEMPOTENCY_MAX_KEYS", "512"))
 
-    # newest first
-    entries = list(reversed(entries))[:limit]
-    return {"entries": entries, "limit": limit, "type": type}
+_IDEMPOTENCY_LOCK = threading.Lock()
+
+
+def _evict_idempotency_keys(now: float) -> None:
+    keys = IDEMPOTENCY["keys"]
+    # Insertion order == age order, so expired keys are always at the front.
+    for k in list(keys):
+        if len(keys) <= IDEMPOTENCY_MAX_KEYS and now - keys[k].get("ts", 0) < IDEMPOTENCY_TTL_SEC:
+            break
+        del keys[k]
+
+
+def _payload_hash(payload: BaseModel) -> str:
+    raw = json.dumps(payload.model_dump(), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _idempotent_create(kind: str, key: Optional[str], payload: BaseModel, create) -> dict:
+    """
+    Run `create()` at most once per (kind, Idempotency-Key) within the TTL.
+    A retried request gets the created entry back (in its current state).
+    """
+    if not key:
+        return create()
+    key = key.strip()
+    if not key or len(key) > 255:
+        raise HTTPException(status_code=400, detail="invalid Idempotency-Key")
+
+    cache_key = f"{kind}:{key}"
+    body = _payload_hash(payload)
+    with _IDEMPOTENCY_LOCK:
+        now = time.time()
+        hit = IDEMPOTENCY["keys"].get(cache_key)
+        if hit is not None and now - hit.get("ts", 0) < IDEMPOTENCY_TTL_SEC:
+            if hit.get("body", body) != body:
+                raise HTTPException(
+                    status_code=422, detail="Idempotency-Key was already used with a different request body"
+                )
+            with STORE_LOCK:
+                idx = _find_entry_index(JOURNAL.get("entries", []), hit.get("entry_id"))
+                if idx == -1:
+                    raise HTTPException(
+                        status_code=409, detail="entry for this Idempotency-Key was deleted"
+                    )
+                return JOURNAL["entries"][idx]
+
+        entry = create()
+        IDEMPOTENCY["keys"].pop(cache_key, None)
+        IDEMPOTENCY["keys"][cache_key] = {"entry_id": entry["id"], "body": body, "ts": now}
+        _evict_idempotency_keys(now)
+        save_json(IDEMPOTENCY_PATH, IDEMPOTENCY)
+        return entry
 
 
 @app.post("/api/v1/journal/daily")
-def create_daily_closeout(payload: DailyCloseoutIn):
+def create_daily_closeout(
+    payload: DailyCloseoutIn,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+):
+    return _idempotent_create("daily", idempotency_key, payload, lambda: _create_daily_closeout(payload))
+
+
+def _create_daily_closeout(payload: DailyCloseoutIn) -> dict:
     wins = [str(w).strip() for w in (payload.wins or []) if str(w).strip()]
     wins = wins[:3]  # keep it tight
     miss = str(payload.miss or "").strip()
@@ -678,9 +1925,15 @@ def create_daily_closeout(payload: DailyCloseoutIn):
 
 
 @app.post("/api/v1/journal/weekly")
-def create_weekly_review(payload: WeeklyReviewIn):
-    global WEEK_STATE
-    WEEK_STATE = normalize_week_state(WEEK_STATE)
+def create_weekly_review(
+    payload: WeeklyReviewIn,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+):
+    return _idempotent_create("weekly", idempotency_key, payload, lambda: _create_weekly_review(payload))
+
+
+def _create_weekly_review(payload: WeeklyReviewIn) -> dict:
+    roll_week_state()
 
     norm_outcomes = []
     for o in payload.outcomes or []:
@@ -702,16 +1955,170 @@ def create_weekly_review(payload: WeeklyReviewIn):
     return _append_journal_entry(entry)
 
 
+# -------------------------------------------------------------------
+# Journal timeline (week-grouped summaries, maintained incrementally)
+# -------------------------------------------------------------------
+# Per ISO week: latest weekly review, daily closeouts, win count and top3
+# completion, without snapshots. Each journal mutation re-renders only the
+# week it touches; the endpoint pages over the sorted week ids.
+_TIMELINE_LOCK = threading.Lock()
+_TIMELINE: dict[str, dict[str, dict]] = {}  # week_id -> {"daily": {id: summary}, "weekly": {...}}
+_TIMELINE_WEEKS: list[str] = []  # sorted week ids with at least one entry
+_TIMELINE_ENTRY_WEEK: dict[str, str] = {}  # entry id -> week_id
+_TIMELINE_VIEWS: dict[str, dict] = {}  # week_id -> rendered group
+
+
+def _entry_week_id(entry: dict) -> Optional[str]:
+    week_id = str(entry.get("week_id") or "")
+    if entry.get("type") == "weekly" and WEEK_ID_RE.match(week_id):
+        return week_id
+    raw = str(entry.get("date") or entry.get("created_at") or "")[:10]
+    try:
+        return current_week_id(date.fromisoformat(raw))
+    except ValueError:
+        return None
+
+
+def _entry_summary(entry: dict) -> dict:
+    if entry.get("type") == "weekly":
+        outcomes = entry.get("outcomes") or []
+        return {
+            "id": entry.get("id"),
+            "created_at": entry.get("created_at", ""),
+            "achieved": sum(1 for o in outcomes if isinstance(o, dict) and o.get("achieved")),
+            "outcomes_total": len(outcomes),
+            "constraint": entry.get("constraint", ""),
+            "decision": entry.get("decision", ""),
+            "next_focus": entry.get("next_focus", ""),
+        }
+    top3 = ((entry.get("snapshot") or {}).get("today") or {}).get("top3") or []
+    return {
+        "id": entry.get("id"),
+        "created_at": entry.get("created_at", ""),
+        "date": entry.get("date"),
+        "wins": entry.get("wins", []),
+        "miss": entry.get("miss", ""),
+        "fix": entry.get("fix", ""),
+        "top3_done": sum(1 for t in top3 if isinstance(t, dict) and t.get("done")),
+        "top3_total": len(top3),
+    }
+
+
+def _render_week(week_id: str) -> None:
+    bucket = _TIMELINE[week_id]
+    dailies = sorted(bucket["daily"].values(), key=lambda d: d["created_at"], reverse=True)
+    weeklies = sorted(bucket["weekly"].values(), key=lambda w: w["created_at"], reverse=True)
+    _TIMELINE_VIEWS[week_id] = {
+        "week_id": week_id,
+        "weekly": weeklies[0] if weeklies else None,
+        "dailies": dailies,
+        "days_closed": len(dailies),
+        "wins": sum(len(d["wins"]) for d in dailies),
+        "top3": {
+            "done": sum(d["top3_done"] for d in dailies),
+            "total": sum(d["top3_total"] for d in dailies),
+        },
+    }
+
+
+def _timeline_add(entry: dict, render: bool = True) -> None:
+    etype = entry.get("type")
+    week_id = _entry_week_id(entry)
+    if etype not in ("daily", "weekly") or week_id is None:
+        return
+    bucket = _TIMELINE.get(week_id)
+    if bucket is None:
+        bucket = _TIMELINE[week_id] = {"daily": {}, "weekly": {}}
+        insort(_TIMELINE_WEEKS, week_id)
+    bucket[etype][entry.get("id")] = _entry_summary(entry)
+    _TIMELINE_ENTRY_WEEK[entry.get("id")] = week_id
+    if render:
+        _render_week(week_id)
+
+
+def _timeline_remove(entry_id: str) -> None:
+    week_id = _TIMELINE_ENTRY_WEEK.pop(entry_id, None)
+    if week_id is None:
+        return
+    bucket = _TIMELINE[week_id]
+    bucket["daily"].pop(entry_id, None)
+    bucket["weekly"].pop(entry_id, None)
+    if bucket["daily"] or bucket["weekly"]:
+        _render_week(week_id)
+        return
+    del _TIMELINE[week_id]
+    _TIMELINE_VIEWS.pop(week_id, None)
+    _TIMELINE_WEEKS.pop(bisect_left(_TIMELINE_WEEKS, week_id))
+
+
+def timeline_apply(record: dict) -> None:
+    """Apply one journal append/update/delete op (same shape as the log record)."""
+    op = record.get("op")
+    with _TIMELINE_LOCK:
+        if op == "append":
+            _timeline_add(record["entry"])
+        elif op == "update":
+            _timeline_remove(record["entry"].get("id"))
+            _timeline_add(record["entry"])
+        elif op == "delete":
+            _timeline_remove(record.get("id"))
+
+
+def rebuild_timeline() -> None:
+    with _TIMELINE_LOCK:
+        _TIMELINE.clear()
+        _TIMELINE_WEEKS.clear()
+        _TIMELINE_ENTRY_WEEK.clear()
+        _TIMELINE_VIEWS.clear()
+        for entry in JOURNAL.get("entries", []):
+            _timeline_add(entry, render=False)
+        for week_id in _TIMELINE:
+            _render_week(week_id)
+
+
+rebuild_timeline()
+
+
+@app.get("/api/v1/journal/timeline")
+def journal_timeline(
+    request: Request,
+    before: Optional[str] = Query(None, description="page cursor: weeks strictly before this week_id"),
+    limit: int = Query(8, ge=1, le=52),
+):
+    if before:
+        _check_week_id(before)
+
+    def build() -> dict:
+        with _TIMELINE_LOCK:
+            hi = bisect_left(_TIMELINE_WEEKS, before) if before else len(_TIMELINE_WEEKS)
+            lo = max(0, hi - limit)
+            week_ids = list(reversed(_TIMELINE_WEEKS[lo:hi]))
+            weeks = [_TIMELINE_VIEWS[w] for w in week_ids]
+        # newest week first
+        return {
+            "weeks": weeks,
+            "limit": limit,
+            "before": before,
+            "next_before": week_ids[-1] if lo > 0 else None,
+        }
+
+    return cached_json_response(
+        request,
+        key=("timeline", before, limit),
+        version=(doc_version(JOURNAL_PATH),),
+        build=build,
+    )
+
+
 @app.get("/api/v1/journal/{entry_id}")
 def get_journal_entry(entry_id: str):
     """
     Optional endpoint (useful for later). Kept lightweight.
     """
-    global JOURNAL
-    JOURNAL = normalize_journal(JOURNAL)
-    for e in JOURNAL.get("entries", []):
-        if e.get("id") == entry_id:
-            return e
+    with STORE_LOCK:
+        idx = _find_entry_index(JOURNAL.get("entries", []), entry_id)
+        if idx != -1:
+            return JOURNAL["entries"][idx]
     raise HTTPException(status_code=404, detail="entry not found")
 
 @app.patch("/api/v1/journal/{entry_id}")
@@ -722,66 +2129,68 @@ def patch_journal_entry(entry_id: str, payload: dict):
     Daily: wins, miss, fix
     Weekly: outcomes, constraint, decision, next_focus
     """
-    global JOURNAL
-    JOURNAL = normalize_journal(JOURNAL)
-    entries = JOURNAL.get("entries", [])
+    # Find + mutate + log under one lock: a concurrent delete must not shift idx.
+    with STORE_LOCK:
+        entries = JOURNAL.get("entries", [])
 
-    idx = _find_entry_index(entries, entry_id)
-    if idx == -1:
-        raise HTTPException(status_code=404, detail="entry not found")
+        idx = _find_entry_index(entries, entry_id)
+        if idx == -1:
+            raise HTTPException(status_code=404, detail="entry not found")
 
-    entry = entries[idx]
-    etype = entry.get("type")
+        entry = entries[idx]
+        etype = entry.get("type")
 
-    # Defensive: enforce dict payload
-    if not isinstance(payload, dict):
-        raise HTTPException(status_code=400, detail="payload must be an object")
+        # Defensive: enforce dict payload
+        if not isinstance(payload, dict):
+            raise HTTPException(status_code=400, detail="payload must be an object")
 
-    if etype == "daily":
-        # Validate via pydantic
-        patch = DailyCloseoutPatch(**payload)
+        if etype == "daily":
+            # Validate via pydantic
+            patch = DailyCloseoutPatch(**payload)
 
-        if patch.wins is not None:
-            entry["wins"] = _clean_wins(patch.wins)
+            if patch.wins is not None:
+                entry["wins"] = _clean_wins(patch.wins)
 
-        if patch.miss is not None:
-            entry["miss"] = str(patch.miss).strip()
+            if patch.miss is not None:
+                entry["miss"] = str(patch.miss).strip()
 
-        if patch.fix is not None:
-            entry["fix"] = str(patch.fix).strip()
+            if patch.fix is not None:
+                entry["fix"] = str(patch.fix).strip()
 
-    elif etype == "weekly":
-        patch = WeeklyReviewPatch(**payload)
+        elif etype == "weekly":
+            patch = WeeklyReviewPatch(**payload)
 
-        if patch.outcomes is not None:
-            norm_outcomes = []
-            for o in patch.outcomes:
-                norm_outcomes.append(
-                    {
-                        "id": str(o.id),
-                        "achieved": bool(o.achieved),
-                        "note": str(o.note or "").strip(),
-                    }
-                )
-            entry["outcomes"] = norm_outcomes
+            if patch.outcomes is not None:
+                norm_outcomes = []
+                for o in patch.outcomes:
+                    norm_outcomes.append(
+                        {
+                            "id": str(o.id),
+                            "achieved": bool(o.achieved),
+                            "note": str(o.note or "").strip(),
+                        }
+                    )
+                entry["outcomes"] = norm_outcomes
 
-        if patch.constraint is not None:
-            entry["constraint"] = str(patch.constraint).strip()
+            if patch.constraint is not None:
+                entry["constraint"] = str(patch.constraint).strip()
 
-        if patch.decision is not None:
-            entry["decision"] = str(patch.decision).strip()
+            if patch.decision is not None:
+                entry["decision"] = str(patch.decision).strip()
 
-        if patch.next_focus is not None:
-            entry["next_focus"] = str(patch.next_focus).strip()
+            if patch.next_focus is not None:
+                entry["next_focus"] = str(patch.next_focus).strip()
 
-    else:
-        raise HTTPException(status_code=400, detail="unsupported entry type")
+        else:
+            raise HTTPException(status_code=400, detail="unsupported entry type")
 
-    # Persist
-    entries[idx] = entry
-    JOURNAL["entries"] = entries
-    save_json(JOURNAL_PATH, JOURNAL)
-    return entry
+        # Persist
+        op = {"op": "update", "entry": entry}
+        entries[idx] = entry
+        JOURNAL["entries"] = entries
+        timeline_apply(op)
+        save_json(JOURNAL_PATH, JOURNAL, op=op)
+        return entry
 
 
 @app.delete("/api/v1/journal/{entry_id}")
@@ -789,17 +2198,18 @@ def delete_journal_entry(entry_id: str):
     """
     Deletes an entry permanently (MVP).
     """
-    global JOURNAL
-    JOURNAL = normalize_journal(JOURNAL)
-    entries = JOURNAL.get("entries", [])
+    with STORE_LOCK:
+        entries = JOURNAL.get("entries", [])
 
-    idx = _find_entry_index(entries, entry_id)
-    if idx == -1:
-        raise HTTPException(status_code=404, detail="entry not found")
+        idx = _find_entry_index(entries, entry_id)
+        if idx == -1:
+            raise HTTPException(status_code=404, detail="entry not found")
 
-    deleted = entries.pop(idx)
-    JOURNAL["entries"] = entries
-    save_json(JOURNAL_PATH, JOURNAL)
+        op = {"op": "delete", "id": entry_id}
+        deleted = entries.pop(idx)
+        JOURNAL["entries"] = entries
+        timeline_apply(op)
+        save_json(JOURNAL_PATH, JOURNAL, op=op)
 
     return {"ok": True, "deleted_id": entry_id, "deleted_type": deleted.get("type")}
 
@@ -808,16 +2218,46 @@ def delete_journal_entry(entry_id: str):
 # Views: Dashboard (Axis v1 one-screen)
 # -------------------------------------------------------------------
 @app.get("/api/v1/views/dashboard")
-def dashboard_view():
-    global TODAY_STATE, WEEK_STATE
+def dashboard_view(request: Request, as_of: Optional[str] = Query(None)):
+    global TODAY_STATE
 
-    TODAY_STATE = normalize_today_state(TODAY_STATE)
-    prev_week_id = WEEK_STATE.get("week_id")
-    WEEK_STATE = normalize_week_state(WEEK_STATE)
-    if WEEK_STATE.get("week_id") != prev_week_id:
-        save_json(WEEK_STATE_PATH, WEEK_STATE)
+    if as_of is not None:
+        try:
+            ts = parse_ts(as_of)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="as_of must be an ISO 8601 timestamp")
+        return cached_json_response(
+            request,
+            key=("dashboard", ts),
+            version=(MUTATION_LOG.last_seq,),
+            build=lambda: dashboard_as_of(ts),
+        )
 
-    projects = PROJECTS.get("projects", [])
+    TODAY_STATE = normalize_today_state(TODAY_STATE)
+    roll_week_state()
+
+    # Date is part of the version: normalize_today_state resets "done" at rollover
+    # without persisting.
+    version = (
+        TODAY_STATE.get("date"),
+        doc_version(TODAY_STATE_PATH),
+        doc_version(WEEK_STATE_PATH),
+        doc_version(PROJECTS_PATH),
+        doc_version(RESOURCES_PATH),
+        doc_version(REALITY_PATH),
+    )
+    return cached_json_response(
+        request,
+        key=("dashboard",),
+        version=version,
+        build=lambda: build_dashboard_payload(TODAY_STATE, WEEK_STATE, PROJECTS, RESOURCES, REALITY),
+    )
+
+
+def build_dashboard_payload(
+    today_state: dict, week_state: dict, projects_doc: dict, resources_doc: dict, reality_doc: dict
+) -> dict:
+    projects = projects_doc.get("projects", [])
     active = [p for p in projects if p.get("is_active") is True][:3]
     week_active_projects = [
         {
@@ -830,7 +2270,7 @@ def dashboard_view():
     ]
 
     drift = {
-        "too_many_outcomes": len(WEEK_STATE.get("outcomes", [])) > 3,
+        "too_many_outcomes": len(week_state.get("outcomes", [])) > 3,
         "too_many_projects": len([p for p in projects if p.get("is_active")]) > 3,
         "consuming_gt_creating": False,
         "low_energy_3_days": False,
@@ -839,20 +2279,20 @@ def dashboard_view():
 
     return {
         "week": {
-            "week_id": WEEK_STATE.get("week_id"),
-            "mode": WEEK_STATE.get("mode", "OFF"),
-            "outcomes": WEEK_STATE.get("outcomes", [])[:3],
+            "week_id": week_state.get("week_id"),
+            "mode": week_state.get("mode", "OFF"),
+            "outcomes": week_state.get("outcomes", [])[:3],
             "active_projects": week_active_projects,
-            "blockers": WEEK_STATE.get("blockers", [])[:3],
-            "anchors": WEEK_STATE.get("anchors", {}),
+            "blockers": week_state.get("blockers", [])[:3],
+            "anchors": week_state.get("anchors", {}),
         },
         "today": {
-            "date": TODAY_STATE.get("date", date.today().isoformat()),
-            "top3": TODAY_STATE.get("top3", [])[:3],
+            "date": today_state.get("date", date.today().isoformat()),
+            "top3": today_state.get("top3", [])[:3],
         },
-        "reality": {"commitments": REALITY.get("commitments", [])},
+        "reality": {"commitments": reality_doc.get("commitments", [])},
         "projects": projects,
-        "resources": RESOURCES.get("sections", [])[:3],
+        "resources": resources_doc.get("sections", [])[:3],
         "drift": drift,
     }
 
@@ -864,7 +2304,7 @@ def dashboard_view():
 def today_view():
     global TODAY_STATE
     TODAY_STATE = normalize_today_state(TODAY_STATE)
-    return TODAY_STATE
+    return public_view(TODAY_STATE)
 
 
 @app.patch("/api/v1/views/today/{kind}/{item_id}")
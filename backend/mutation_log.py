@@ -0,0 +1,160 @@
+# backend/mutation_log.py — sequenced, append-only log of persisted mutations
+"""
+Every document write is recorded as one JSON line with a gap-free `seq`.
+
+On disk the log is split into segments named after their first seq
+(<dir>/000000000001.jsonl, ...), so reading from an old seq only touches the
+segments that can contain it. The newest records are also kept in memory for
+cheap tail reads (replication followers poll the tail).
+
+Callers serialize appends (main.py holds STORE_LOCK); reads are safe concurrently.
+"""
+from __future__ import annotations
+
+import json
+import threading
+from bisect import bisect_right
+from collections import deque
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+
+class MutationLog:
+    def __init__(self, directory: Path, segment_records: int = 5000, tail_records: int = 2000) -> None:
+        self.dir = directory
+        self.segment_records = segment_records
+        self._tail: deque[dict] = deque(maxlen=tail_records)
+        self._lock = threading.Lock()
+        self.dir.mkdir(parents=True, exist_ok=True)
+
+        self._segments: list[int] = sorted(int(p.stem) for p in self.dir.glob("*.jsonl"))
+        self.last_seq = 0
+        self._segment_count = 0
+        if self._segments:
+            self._repair_tail(self._segment_path(self._segments[-1]))
+            records = list(self._read_segment(self._segments[-1]))
+            self._segment_count = len(records)
+            if records:
+                self.last_seq = records[-1]["seq"]
+                self._tail.extend(records)
+            else:
+                self.last_seq = self._segments[-1] - 1
+
+    # ---------------------------------------------------------------
+    # Write
+    # ---------------------------------------------------------------
+    def append(self, record: dict) -> dict:
+        """
+        Append `record`. A record that already carries a seq (replicated from a
+        primary) must be the next one in sequence; otherwise a seq is assigned.
+        """
+        with self._lock:
+            seq = record.get("seq")
+            if seq is None:
+                record = {"seq": self.last_seq + 1, **record}
+            elif seq != self.last_seq + 1:
+                raise ValueError(f"out-of-order log record: got seq {seq}, expected {self.last_seq + 1}")
+
+            if not self._segments or self._segment_count >= self.segment_records:
+                self._segments.append(record["seq"])
+                self._segment_count = 0
+
+            line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+            with self._segment_path(self._segments[-1]).open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self._segment_count += 1
+            self.last_seq = record["seq"]
+            # Keep a private copy: callers keep mutating the live documents.
+            record = json.loads(line)
+            self._tail.append(record)
+            return record
+
+    def reset(self, last_seq: int) -> None:
+        """Drop all records and continue numbering after `last_seq` (follower resync)."""
+        with self._lock:
+            for first in self._segments:
+                self._segment_path(first).unlink(missing_ok=True)
+            self._segments = [last_seq + 1]
+            self._segment_path(last_seq + 1).touch()
+            self._segment_count = 0
+            self._tail.clear()
+            self.last_seq = last_seq
+
+    def truncate(self, before_seq: int) -> int:
+        """
+        Delete whole segments holding only records with seq < before_seq (the
+        active segment is always kept). Returns the number of segments removed.
+        """
+        with self._lock:
+            drop = max(0, bisect_right(self._segments, before_seq) - 1)
+            for first in self._segments[:drop]:
+                self._segment_path(first).unlink(missing_ok=True)
+            del self._segments[:drop]
+            return drop
+
+    # ---------------------------------------------------------------
+    # Read
+    # ---------------------------------------------------------------
+    @property
+    def first_seq(self) -> int:
+        """Oldest seq still available (last_seq + 1 when the log is empty)."""
+        return self._segments[0] if self._segments else self.last_seq + 1
+
+    def read_since(self, seq: int, limit: int = 500) -> list[dict]:
+        """Records with record.seq > seq, oldest first, at most `limit`."""
+        tail = list(self._tail)
+        if tail and tail[0]["seq"] <= seq + 1:
+            start = seq + 1 - tail[0]["seq"]
+            return tail[start : start + limit]
+        out = []
+        for record in self.iter_from(seq + 1):
+            out.append(record)
+            if len(out) >= limit:
+                break
+        return out
+
+    def iter_from(self, seq: int, docs: Optional[Iterable[str]] = None) -> Iterator[dict]:
+        """
+        All records with record.seq >= seq, oldest first (reads from disk).
+        With `docs`, only records for those document names; other lines are
+        skipped before parsing (journal appends carry whole snapshots).
+        """
+        wanted = needles = None
+        if docs is not None:
+            wanted = set(docs)
+            # Quotes inside JSON string values are escaped, so this text only
+            # matches a "doc" field; the parsed record is still checked.
+            needles = tuple(json.dumps({"doc": d}, separators=(",", ":"))[1:-1] for d in wanted)
+        segments = list(self._segments)
+        idx = max(0, bisect_right(segments, seq) - 1)
+        for first in segments[idx:]:
+            for record in self._read_segment(first, needles):
+                if record["seq"] >= seq and (wanted is None or record.get("doc") in wanted):
+                    yield record
+
+    @staticmethod
+    def _repair_tail(path: Path) -> None:
+        # A crash mid-append leaves a partial last line; cut it so the next
+        # append starts on a clean line.
+        data = path.read_bytes()
+        if data and not data.endswith(b"\n"):
+            path.write_bytes(data[: data.rfind(b"\n") + 1])
+
+    def _segment_path(self, first_seq: int) -> Path:
+        return self.dir / f"{first_seq:012d}.jsonl"
+
+    def _read_segment(self, first_seq: int, needles: Optional[tuple[str, ...]] = None) -> Iterator[dict]:
+        path = self._segment_path(first_seq)
+        if not path.exists():
+            return
+        with path.open("r", encoding="utf-8") as f:
+            for line in f:
+                if needles is not None and not any(n in line for n in needles):
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Torn last line after a crash: everything before it is intact.
+                    return
+                if isinstance(record, dict) and isinstance(record.get("seq"), int):
+                    yield record
@@ -0,0 +1,119 @@
+# backend/test_replication.py — primary + follower as two real processes
+"""
+Run from backend/:  python -m pytest -q test_replication.py
+"""
+from __future__ import annotations
+
+import time
+import urllib.error
+
+import pytest
+
+from loadtest import _free_port, _request, start_server
+
+POLL_ENV = {"REPLICA_POLL_SEC": "0.1"}
+
+
+@pytest.fixture
+def servers():
+    procs = []
+
+    def start(data_dir, **env):
+        proc, base_url = start_server(data_dir, _free_port(), env={**POLL_ENV, **env})
+        procs.append(proc)
+        return proc, base_url
+
+    yield start
+    for proc in procs:
+        if proc.poll() is None:
+            proc.terminate()
+            proc.wait(timeout=20)
+
+
+def stop(proc) -> None:
+    proc.terminate()
+    proc.wait(timeout=20)
+
+
+def wait_for(fn, timeout: float = 15.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            result = fn()
+            if result:
+                return result
+        except (urllib.error.URLError, ConnectionError, KeyError):
+            pass
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met before timeout")
+        time.sleep(0.1)
+
+
+def put_outcomes(base_url: str, text: str) -> dict:
+    return _request(base_url, "PUT", "/api/v1/week/outcomes", {"outcomes": [text]})
+
+
+def first_outcome(base_url: str) -> str:
+    return _request(base_url, "GET", "/api/v1/views/dashboard")["week"]["outcomes"][0]["text"]
+
+
+def journal_ids(base_url: str) -> set[str]:
+    return {e["id"] for e in _request(base_url, "GET", "/api/v1/journal")["entries"]}
+
+
+def test_bootstrap_catch_up_reject_and_promote(servers, tmp_path):
+    primary, primary_url = servers(tmp_path / "primary")
+    put_outcomes(primary_url, "one")
+
+    # Bootstrap: a fresh follower installs a snapshot, then streams the log.
+    replica_env = {"REPLICA_OF": primary_url}
+    follower, follower_url = servers(tmp_path / "replica", **replica_env)
+    wait_for(lambda: first_outcome(follower_url) == "one")
+
+    # Writes are rejected while following.
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        put_outcomes(follower_url, "nope")
+    assert exc.value.code == 503
+
+    # Catch-up: writes made while the follower is down are applied on restart.
+    stop(follower)
+    put_outcomes(primary_url, "two")
+    entry = _request(primary_url, "POST", "/api/v1/journal/daily", {"wins": ["shipped"]})
+    follower, follower_url = servers(tmp_path / "replica", **replica_env)
+    wait_for(lambda: first_outcome(follower_url) == "two" and entry["id"] in journal_ids(follower_url))
+
+    # Promote: the follower accepts writes, and stays primary across a restart
+    # even though REPLICA_OF is still set.
+    stop(primary)
+    status = _request(follower_url, "POST", "/api/v1/replication/promote")
+    assert status["role"] == "primary"
+    put_outcomes(follower_url, "three")
+
+    stop(follower)
+    follower, follower_url = servers(tmp_path / "replica", **replica_env)
+    assert _request(follower_url, "GET", "/api/v1/replication/status")["role"] == "primary"
+    put_outcomes(follower_url, "four")
+    assert first_outcome(follower_url) == "four"
+
+
+def test_follower_behind_truncated_log_rebootstraps(servers, tmp_path):
+    primary, primary_url = servers(
+        tmp_path / "primary", CHECKPOINT_EVERY="5", CHECKPOINT_KEEP="1", MUTATION_LOG_SEGMENT_RECORDS="5"
+    )
+    replica_env = {"REPLICA_OF": primary_url}
+    follower, follower_url = servers(tmp_path / "replica", **replica_env)
+    put_outcomes(primary_url, "start")
+    wait_for(lambda: first_outcome(follower_url) == "start")
+    follower_seq = _request(follower_url, "GET", "/api/v1/replication/status")["last_seq"]
+
+    stop(follower)
+    for i in range(40):
+        put_outcomes(primary_url, f"v{i}")
+    # Checkpoints roll in the background; retention then drops the old segments.
+    wait_for(lambda: _request(primary_url, "GET", "/api/v1/replication/status")["first_seq"] > follower_seq + 1)
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        _request(primary_url, "GET", f"/api/v1/replication/log?since={follower_seq}")
+    assert exc.value.code == 410
+
+    follower, follower_url = servers(tmp_path / "replica", **replica_env)
+    wait_for(lambda: first_outcome(follower_url) == "v39")
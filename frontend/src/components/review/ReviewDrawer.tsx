@@ -4,7 +4,8 @@ import { AlertTriangle, ClipboardCheck, X } from "lucide-react";
 
 import {
   useDeleteJournalEntry,
-  useJournalList,
+  useFetchJournalEntry,
+  useJournalTimeline,
   useUpdateJournalEntry,
   type JournalEntry,
 } from "../../hooks/useJournal";
@@ -278,7 +279,8 @@ export function ReviewDrawer({ open, onClose }: Props) {
   useLockBodyScroll(open);
 
   const s = useReviewState(open);
-  const journal = useJournalList({ limit: 50 });
+  const journal = useJournalTimeline({ limit: 8 });
+  const fetchEntry = useFetchJournalEntry();
 
   const updateEntry = useUpdateJournalEntry();
   const deleteEntry = useDeleteJournalEntry();
@@ -287,6 +289,21 @@ export function ReviewDrawer({ open, onClose }: Props) {
 
   // ✅ Read-only view modal state
   const [viewEntry, setViewEntry] = useState<JournalEntry | null>(null);
+  const [entryError, setEntryError] = useState<string | null>(null);
+
+  // Timeline cards are summaries; weekly outcomes need the full entry.
+  async function withFullEntry(
+    entry: JournalEntry,
+    then: (full: JournalEntry) => void,
+  ) {
+    if (entry.type !== "weekly") return then(entry);
+    try {
+      setEntryError(null);
+      then(await fetchEntry(entry.id));
+    } catch (e) {
+      setEntryError(String((e as any)?.message ?? "Failed to load entry"));
+    }
+  }
 
   // ESC closes drawer
   useEffect(() => {
@@ -340,7 +357,7 @@ export function ReviewDrawer({ open, onClose }: Props) {
 
 
   const portalTarget = s.portalTarget;
-  const entries: JournalEntry[] = journal.data?.entries ?? [];
+  const weeks = journal.data?.pages.flatMap((p) => p.weeks) ?? [];
 
   if (!portalTarget) return null;
 
@@ -499,7 +516,7 @@ export function ReviewDrawer({ open, onClose }: Props) {
                     Journal Timeline
                   </div>
                   <div className="text-sm text-slate-300">
-                    Latest entries (newest first)
+                    Grouped by week (newest first)
                   </div>
                 </div>
 
@@ -523,22 +540,26 @@ export function ReviewDrawer({ open, onClose }: Props) {
               ) : (
                 <>
                   <JournalTimeline
-                    entries={entries}
+                    weeks={weeks}
                     isBusy={isBusy}
-                    onOpen={(entry) => setViewEntry(entry)}
-                    onEdit={s.openEdit}
+                    onOpen={(entry) => withFullEntry(entry, setViewEntry)}
+                    onEdit={(entry) => withFullEntry(entry, s.openEdit)}
                     onDelete={(id) => s.setDeleteId(id)}
+                    hasMore={journal.hasNextPage}
+                    isLoadingMore={journal.isFetchingNextPage}
+                    onLoadMore={() => journal.fetchNextPage()}
                   />
 
-                  {!entries.length && (
+                  {!weeks.length && (
                     <div className="text-sm text-slate-500">No entries yet.</div>
                   )}
 
-                  {(updateEntry.isError || deleteEntry.isError) && (
+                  {(updateEntry.isError || deleteEntry.isError || entryError) && (
                     <div className="rounded-xl border border-red-900/40 bg-red-950/20 p-3 text-xs text-red-200">
                       {String(
                         (updateEntry.error as any)?.message ??
                           (deleteEntry.error as any)?.message ??
+                          entryError ??
                           "Operation failed"
                       )}
                     </div>
@@ -1,6 +1,11 @@
 import * as React from "react";
 import { JournalEntryCard } from "./JournalEntryCard";
-import type { JournalEntry } from "../../../hooks/useJournal";
+import type {
+  JournalEntry,
+  TimelineDaily,
+  TimelineWeek,
+  TimelineWeekly,
+} from "../../../hooks/useJournal";
 
 /* ======================
    Life Areas (canonical)
@@ -86,22 +91,58 @@ function getDailyEntryArea(entry: JournalEntry): LifeArea {
   return dominantArea(snap.tasks.map((t) => t.area ?? "none"));
 }
 
+/* ======================
+   Summary → card entry
+====================== */
+
+// Timeline rows carry no snapshot and no weekly outcomes; the card only
+// needs the text fields. Callers fetch the full entry when opening a weekly.
+function dailyToEntry(d: TimelineDaily): JournalEntry {
+  return {
+    id: d.id,
+    type: "daily",
+    created_at: d.created_at,
+    date: d.date,
+    wins: d.wins,
+    miss: d.miss,
+    fix: d.fix,
+  };
+}
+
+function weeklyToEntry(w: TimelineWeekly, weekId: string): JournalEntry {
+  return {
+    id: w.id,
+    type: "weekly",
+    created_at: w.created_at,
+    week_id: weekId,
+    constraint: w.constraint,
+    decision: w.decision,
+    next_focus: w.next_focus,
+  };
+}
+
 /* ======================
    Component
 ====================== */
 
 export function JournalTimeline({
-  entries,
+  weeks,
   onOpen,
   onEdit,
   onDelete,
   isBusy,
+  hasMore,
+  isLoadingMore,
+  onLoadMore,
 }: {
-  entries: JournalEntry[];
+  weeks: TimelineWeek[];
   onOpen: (entry: JournalEntry) => void;
   onEdit: (entry: JournalEntry) => void;
   onDelete: (id: string) => void;
   isBusy?: boolean;
+  hasMore?: boolean;
+  isLoadingMore?: boolean;
+  onLoadMore?: () => void;
 }) {
   const [typeFilter, setTypeFilter] = React.useState<
     "all" | "daily" | "weekly"
@@ -109,30 +150,43 @@ export function JournalTimeline({
 
   const [areaFilter, setAreaFilter] = React.useState<LifeArea | "all">("all");
 
-  const enriched = React.useMemo(() => {
-    return entries.map((entry) => {
-      const area =
-        entry.type === "daily" ? getDailyEntryArea(entry) : "none";
+  const grouped = React.useMemo(() => {
+    return weeks.map((week) => {
+      const entries = [
+        ...(week.weekly ? [weeklyToEntry(week.weekly, week.week_id)] : []),
+        ...week.dailies.map(dailyToEntry),
+      ];
 
-      return { entry, area };
+      return {
+        week,
+        items: entries.map((entry) => ({
+          entry,
+          area: entry.type === "daily" ? getDailyEntryArea(entry) : "none",
+        })),
+      };
     });
-  }, [entries]);
+  }, [weeks]);
 
   const filtered = React.useMemo(() => {
-    return enriched.filter(({ entry, area }) => {
-      if (typeFilter !== "all" && entry.type !== typeFilter) return false;
-      if (areaFilter !== "all" && area !== areaFilter) return false;
-      return true;
-    });
-  }, [enriched, typeFilter, areaFilter]);
+    return grouped
+      .map(({ week, items }) => ({
+        week,
+        items: items.filter(({ entry, area }) => {
+          if (typeFilter !== "all" && entry.type !== typeFilter) return false;
+          if (areaFilter !== "all" && area !== areaFilter) return false;
+          return true;
+        }),
+      }))
+      .filter(({ items }) => items.length > 0);
+  }, [grouped, typeFilter, areaFilter]);
 
   const counts = React.useMemo(() => {
-    return {
-      total: entries.length,
-      daily: entries.filter((e) => e.type === "daily").length,
-      weekly: entries.filter((e) => e.type === "weekly").length,
-    };
-  }, [entries]);
+    const daily = weeks.reduce((n, w) => n + w.dailies.length, 0);
+    const weekly = weeks.filter((w) => w.weekly).length;
+    return { total: daily + weekly, daily, weekly };
+  }, [weeks]);
+
+  const shown = filtered.reduce((n, g) => n + g.items.length, 0);
 
   return (
     <div className="space-y-3">
@@ -182,29 +236,68 @@ export function JournalTimeline({
         </div>
 
         <div className="text-xs text-slate-500">
-          Showing{" "}
-          <span className="text-slate-300">{filtered.length}</span> /{" "}
-          <span className="text-slate-300">{entries.length}</span>
+          Showing <span className="text-slate-300">{shown}</span> /{" "}
+          <span className="text-slate-300">{counts.total}</span>
         </div>
       </div>
 
-      {/* Timeline */}
+      {/* Timeline, one group per ISO week */}
       {filtered.length ? (
-        filtered.map(({ entry }) => (
-          <JournalEntryCard
-            key={entry.id}
-            entry={entry}
-            isBusy={isBusy}
-            onOpen={() => onOpen(entry)}
-            onEdit={() => onEdit(entry)}
-            onDelete={() => onDelete(entry.id)}
-          />
+        filtered.map(({ week, items }) => (
+          <div key={week.week_id} className="space-y-2">
+            <div className="flex flex-wrap items-baseline justify-between gap-2 px-1">
+              <div className="text-[11px] uppercase tracking-[0.2em] text-slate-400">
+                {week.week_id}
+              </div>
+              <div className="text-xs text-slate-500">
+                {week.days_closed} day{week.days_closed === 1 ? "" : "s"} closed
+                {" · "}
+                {week.wins} win{week.wins === 1 ? "" : "s"}
+                {week.top3.total ? (
+                  <>
+                    {" · "}Top 3 {week.top3.done}/{week.top3.total}
+                  </>
+                ) : null}
+                {week.weekly?.outcomes_total ? (
+                  <>
+                    {" · "}Outcomes {week.weekly.achieved}/
+                    {week.weekly.outcomes_total}
+                  </>
+                ) : null}
+              </div>
+            </div>
+
+            {items.map(({ entry }) => (
+              <JournalEntryCard
+                key={entry.id}
+                entry={entry}
+                isBusy={isBusy}
+                onOpen={() => onOpen(entry)}
+                onEdit={() => onEdit(entry)}
+                onDelete={() => onDelete(entry.id)}
+              />
+            ))}
+          </div>
         ))
       ) : (
         <div className="rounded-xl border border-slate-800/60 bg-slate-950/30 p-4 text-sm text-slate-400">
           No entries match the selected filters.
         </div>
       )}
+
+      {hasMore && onLoadMore ? (
+        <button
+          type="button"
+          disabled={isLoadingMore}
+          onClick={onLoadMore}
+          className={[
+            "w-full rounded-lg border border-slate-800/70 bg-slate-950/30 px-3 py-1.5 text-xs text-slate-300 hover:text-white",
+            isLoadingMore ? "opacity-60 cursor-not-allowed" : "",
+          ].join(" ")}
+        >
+          {isLoadingMore ? "Loading…" : "Load older weeks"}
+        </button>
+      ) : null}
     </div>
   );
 }
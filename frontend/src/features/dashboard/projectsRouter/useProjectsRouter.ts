@@ -2,6 +2,8 @@
 import * as React from "react";
 import type { QueryClient } from "@tanstack/react-query";
 
+import { patchJSON } from "../../../lib/api";
+
 type Link = { label: string; url: string };
 type Project = { key: string; name: string; is_active?: boolean; links: Link[] };
 
@@ -94,14 +96,18 @@ export function useProjectsRouter(params: {
       return;
     }
 
-    const nextProjects = projects.map((p) =>
-      p.key === key ? { ...p, is_active: nextActive } : p
-    );
-
+    setProjectSaving(true);
+    setProjectSaveError(null);
     try {
-      await saveProjects(nextProjects);
-    } catch {
-      // error already set
+      // Delta-only: server enforces the max-3 rule on the single project.
+      await patchJSON(`/api/v1/projects/${encodeURIComponent(key)}`, {
+        is_active: nextActive,
+      });
+      await queryClient.invalidateQueries({ queryKey: ["dashboard"] });
+    } catch (e) {
+      setProjectSaveError(e instanceof Error ? e.message : String(e));
+    } finally {
+      setProjectSaving(false);
     }
   }
 
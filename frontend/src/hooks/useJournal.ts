@@ -1,5 +1,9 @@
-import { useMutation, useQuery, useQueryClient } from "@tanstack/react-query";
-import { postJSON } from "../features/dashboard/api/postJSON";
+import {
+  useInfiniteQuery,
+  useMutation,
+  useQuery,
+  useQueryClient,
+} from "@tanstack/react-query";
 
 export type JournalEntry = {
   id: string;
@@ -22,6 +26,44 @@ export type JournalEntry = {
   snapshot?: any;
 };
 
+/** Timeline rows are summaries: no snapshots, weekly outcomes only as counts. */
+export type TimelineDaily = {
+  id: string;
+  created_at: string;
+  date?: string;
+  wins: string[];
+  miss: string;
+  fix: string;
+  top3_done: number;
+  top3_total: number;
+};
+
+export type TimelineWeekly = {
+  id: string;
+  created_at: string;
+  achieved: number;
+  outcomes_total: number;
+  constraint: string;
+  decision: string;
+  next_focus: string;
+};
+
+export type TimelineWeek = {
+  week_id: string;
+  weekly: TimelineWeekly | null;
+  dailies: TimelineDaily[];
+  days_closed: number;
+  wins: number;
+  top3: { done: number; total: number };
+};
+
+export type TimelinePage = {
+  weeks: TimelineWeek[];
+  limit: number;
+  before: string | null;
+  next_before: string | null;
+};
+
 export type UpdateJournalEntryPayload =
   | {
       type: "daily";
@@ -48,25 +90,42 @@ function toApiUrl(path: string) {
   return base ? `${base}${path}` : path;
 }
 
+/** Non-2xx response; keeps the status and Retry-After for callers that retry. */
+class HttpError extends Error {
+  readonly status: number;
+  readonly retryAfter: string | null;
+
+  constructor(message: string, status: number, retryAfter: string | null) {
+    super(message);
+    this.name = "HttpError";
+    this.status = status;
+    this.retryAfter = retryAfter;
+  }
+}
+
 async function requestJSON<T>(
   url: string,
   init: RequestInit & { json?: any } = {},
 ): Promise<T> {
-  const { json, ...rest } = init;
+  const { json, headers, ...rest } = init;
 
   const res = await fetch(toApiUrl(url), {
     credentials: "include",
+    ...rest,
     headers: {
       ...(json ? { "Content-Type": "application/json" } : {}),
-      ...(rest.headers ?? {}),
+      ...(headers ?? {}),
     },
     body: json ? JSON.stringify(json) : rest.body,
-    ...rest,
   });
 
   if (!res.ok) {
     const text = await res.text().catch(() => "");
-    throw new Error(text || `${rest.method ?? "GET"} ${url} failed (${res.status})`);
+    throw new HttpError(
+      text || `${rest.method ?? "GET"} ${url} failed (${res.status})`,
+      res.status,
+      res.headers.get("Retry-After"),
+    );
   }
 
   // DELETE may return 204 with empty body
@@ -78,6 +137,56 @@ async function getJSON<T>(url: string): Promise<T> {
   return requestJSON<T>(url, { method: "GET" });
 }
 
+const RETRY_BASE_MS = 500;
+const RETRY_MAX_MS = 10_000;
+
+function sleep(ms: number) {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+/** Retry-After is either delay-seconds or an HTTP date. */
+function parseRetryAfter(value: string | null): number | null {
+  if (!value) return null;
+  const seconds = Number(value);
+  if (Number.isFinite(seconds)) return Math.max(0, seconds * 1000);
+  const at = Date.parse(value);
+  return Number.isNaN(at) ? null : Math.max(0, at - Date.now());
+}
+
+/** Delay before the next attempt, or null if `e` is not worth retrying. */
+function retryDelay(e: unknown, attempt: number): number | null {
+  const backoff = RETRY_BASE_MS * 2 ** attempt;
+  if (e instanceof TypeError) return backoff; // network failure
+  if (e instanceof HttpError && e.status === 503) {
+    // Admission control sheds load with 503 + Retry-After.
+    return Math.min(parseRetryAfter(e.retryAfter) ?? backoff, RETRY_MAX_MS);
+  }
+  return null;
+}
+
+/**
+ * POST with one Idempotency-Key shared by all attempts, so a retry after a
+ * dropped response returns the original entry instead of creating a duplicate.
+ * Network failures and 503s are retried with backoff (honouring Retry-After);
+ * other HTTP errors are thrown as-is.
+ */
+async function postIdempotent<T>(url: string, json: unknown, attempts = 3): Promise<T> {
+  const key = crypto.randomUUID();
+  for (let i = 0; ; i++) {
+    try {
+      return await requestJSON<T>(url, {
+        method: "POST",
+        json,
+        headers: { "Idempotency-Key": key },
+      });
+    } catch (e) {
+      const delay = retryDelay(e, i);
+      if (delay === null || i + 1 >= attempts) throw e;
+      await sleep(delay);
+    }
+  }
+}
+
 export function useJournalList(params?: { limit?: number; type?: "daily" | "weekly" }) {
   const limit = params?.limit ?? 50;
   const type = params?.type;
@@ -93,12 +202,40 @@ export function useJournalList(params?: { limit?: number; type?: "daily" | "week
   });
 }
 
+/** Week-grouped journal, newest week first; older weeks load via the `before` cursor. */
+export function useJournalTimeline(params?: { limit?: number }) {
+  const limit = params?.limit ?? 8;
+
+  return useInfiniteQuery({
+    queryKey: ["journal", "timeline", { limit }],
+    initialPageParam: null as string | null,
+    queryFn: async ({ pageParam }) => {
+      const qs = new URLSearchParams();
+      qs.set("limit", String(limit));
+      if (pageParam) qs.set("before", pageParam);
+      return getJSON<TimelinePage>(`/api/v1/journal/timeline?${qs.toString()}`);
+    },
+    getNextPageParam: (last) => last.next_before,
+  });
+}
+
+/** Full entry (with weekly outcomes) for the view/edit modals. */
+export function useFetchJournalEntry() {
+  const qc = useQueryClient();
+
+  return (id: string) =>
+    qc.fetchQuery({
+      queryKey: ["journal", "entry", id],
+      queryFn: async () => getJSON<JournalEntry>(`/api/v1/journal/${id}`),
+    });
+}
+
 export function useCreateDailyCloseout() {
   const qc = useQueryClient();
 
   return useMutation({
     mutationFn: async (payload: { wins: string[]; miss: string; fix: string }) => {
-      return await postJSON<JournalEntry>("/api/v1/journal/daily", payload);
+      return await postIdempotent<JournalEntry>("/api/v1/journal/daily", payload);
     },
     onSuccess: async () => {
       await qc.invalidateQueries({ queryKey: ["journal"] });
@@ -116,7 +253,7 @@ export function useCreateWeeklyReview() {
       decision: string;
       next_focus: string;
     }) => {
-      return await postJSON<JournalEntry>("/api/v1/journal/weekly", payload);
+      return await postIdempotent<JournalEntry>("/api/v1/journal/weekly", payload);
     },
     onSuccess: async () => {
       await qc.invalidateQueries({ queryKey: ["journal"] });